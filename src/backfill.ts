@@ -1,7 +1,12 @@
 import { existsSync, readdirSync, readFileSync } from "node:fs";
 import { resolve } from "node:path";
 import { getDreamsDir, getNightmaresDir } from "./config.js";
-import { storeDeepMemory, registerDream, getDreamRemembrances } from "./memory.js";
+import {
+  storeDeepMemories,
+  registerDream,
+  getDreamRemembrances,
+  withTransaction,
+} from "./memory.js";
 import { loadState, saveState } from "./state.js";
 import logger from "./logger.js";
 
@@ -18,52 +23,60 @@ export async function ensureBackfilled(): Promise<void> {
   }
 
   logger.info("Starting initial dream remembrance backfill...");
-  let backfillCount = 0;
   const existing = new Set(getDreamRemembrances().map((r) => r.filename));
+  const pending: Array<{
+    filename: string;
+    title: string;
+    date: string;
+    content: string;
+    isNightmare: boolean;
+  }> = [];
 
-  // 1. Backfill from local disk (Dreams)
-  if (existsSync(getDreamsDir())) {
-    const files = readdirSync(getDreamsDir()).filter((f) => f.endsWith(".md"));
+  // Collect dreams and nightmares from local disk
+  const sources: Array<{ dir: string; isNightmare: boolean }> = [
+    { dir: getDreamsDir(), isNightmare: false },
+    { dir: getNightmaresDir(), isNightmare: true },
+  ];
+  for (const { dir, isNightmare } of sources) {
+    if (!existsSync(dir)) continue;
+    const files = readdirSync(dir).filter((f) => f.endsWith(".md"));
     for (const f of files) {
       if (existing.has(f)) continue;
       const parsed = parseFilename(f);
       if (!parsed) continue;
 
-      const content = readFileSync(resolve(getDreamsDir(), f), "utf-8");
-      const deepMemoryId = storeDeepMemory(
-        { text_summary: parsed.title, markdown: content, isNightmare: false },
-        "dream"
-      );
-      registerDream(f, parsed.title, parsed.date, {
-        isNightmare: false,
-        deepMemoryId,
+      pending.push({
+        filename: f,
+        title: parsed.title,
+        date: parsed.date,
+        content: readFileSync(resolve(dir, f), "utf-8"),
+        isNightmare,
       });
       existing.add(f);
-      backfillCount++;
     }
   }
 
-  // 2. Backfill from local disk (Nightmares)
-  if (existsSync(getNightmaresDir())) {
-    const files = readdirSync(getNightmaresDir()).filter((f) => f.endsWith(".md"));
-    for (const f of files) {
-      if (existing.has(f)) continue;
-      const parsed = parseFilename(f);
-      if (!parsed) continue;
-
-      const content = readFileSync(resolve(getNightmaresDir(), f), "utf-8");
-      const deepMemoryId = storeDeepMemory(
-        { text_summary: parsed.title, markdown: content, isNightmare: true },
-        "nightmare"
-      );
-      registerDream(f, parsed.title, parsed.date, {
-        isNightmare: true,
-        deepMemoryId,
+  // Store and register all recovered dreams in one transaction, so the whole
+  // backfill commits once instead of twice per file
+  withTransaction(() => {
+    const deepMemoryIds = storeDeepMemories(
+      pending.map((p) => ({
+        content: {
+          text_summary: p.title,
+          markdown: p.content,
+          isNightmare: p.isNightmare,
+        },
+        category: p.isNightmare ? "nightmare" : "dream",
+      }))
+    );
+    pending.forEach((p, i) => {
+      registerDream(p.filename, p.title, p.date, {
+        isNightmare: p.isNightmare,
+        deepMemoryId: deepMemoryIds[i],
       });
-      existing.add(f);
-      backfillCount++;
-    }
-  }
+    });
+  });
+  const backfillCount = pending.length;
 
   logger.info(`Dream backfill complete. Recovered ${backfillCount} dreams.`);
   state.dreams_backfilled = true;
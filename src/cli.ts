@@ -12,12 +12,26 @@
 
 import { Command } from "commander";
 import chalk from "chalk";
-import { readdirSync, readFileSync } from "node:fs";
+import { readdirSync, openSync, readSync, closeSync } from "node:fs";
 import { resolve } from "node:path";
-import { setVerbose } from "./logger.js";
 import { getDreamsDir, getNightmaresDir } from "./config.js";
 import type { AgentState, DeepMemoryStats, OpenClawAPI } from "./types.js";
 
+/**
+ * Read just the first line of a file. Listings only need the title line,
+ * so avoid loading whole dream narratives into memory.
+ */
+function readFirstLine(path: string): string {
+  const buf = Buffer.alloc(4096);
+  const fd = openSync(path, "r");
+  try {
+    const bytesRead = readSync(fd, buf, 0, buf.length, 0);
+    return buf.toString("utf-8", 0, bytesRead).split("\n", 1)[0];
+  } finally {
+    closeSync(fd);
+  }
+}
+
 /**
  * Register all ElectricSheep subcommands onto a parent Command.
  * Used both by the standalone bin and by api.registerCli().
@@ -25,9 +39,13 @@ import type { AgentState, DeepMemoryStats, OpenClawAPI } from "./types.js";
 export function registerCommands(parent: Command): void {
   parent
     .option("-v, --verbose", "Enable verbose logging")
-    .hook("preAction", (thisCommand) => {
+    .hook("preAction", async (thisCommand) => {
       const opts = thisCommand.opts();
-      if (opts.verbose) setVerbose(true);
+      // Logger (winston + transports) is only loaded when actually needed
+      if (opts.verbose) {
+        const { setVerbose } = await import("./logger.js");
+        setVerbose(true);
+      }
     });
 
   parent
@@ -68,7 +86,7 @@ export function registerCommands(parent: Command): void {
     .action(async () => {
       const { deepMemoryStats } = await import("./memory.js");
       const { loadState } = await import("./state.js");
-      const { MoltbookClient } = await import("./moltbook.js");
+      const { getMoltbookClient } = await import("./moltbook.js");
       const { getBudgetStatus } = await import("./budget.js");
 
       const state: AgentState = loadState();
@@ -110,13 +128,19 @@ export function registerCommands(parent: Command): void {
 
       // Moltbook status
       try {
-        const client = new MoltbookClient();
-        const moltbookStatus = await client.status();
+        const client = getMoltbookClient();
+        // Independent GETs — issue both at once rather than paying two serial RTTs,
+        // but settle each on its own so a failed profile still shows the status
+        const [moltbookStatus, profile] = await Promise.allSettled([
+          client.status(),
+          client.me(),
+        ]);
+        if (moltbookStatus.status === "rejected") throw moltbookStatus.reason;
         console.log(
-          `\n${chalk.bold("Moltbook:")} ${(moltbookStatus as Record<string, unknown>).status ?? "?"}`
+          `\n${chalk.bold("Moltbook:")} ${(moltbookStatus.value as Record<string, unknown>).status ?? "?"}`
         );
-        const profile = await client.me();
-        const agent = (profile.agent ?? profile) as Record<string, unknown>;
+        if (profile.status === "rejected") throw profile.reason;
+        const agent = (profile.value.agent ?? profile.value) as Record<string, unknown>;
         console.log(`${chalk.bold("Karma:")} ${agent.karma ?? 0}`);
       } catch {
         console.log(chalk.yellow("\nMoltbook: not connected"));
@@ -155,8 +179,7 @@ export function registerCommands(parent: Command): void {
       console.log(chalk.magenta.bold(`\nDream Archive (${dreamFiles.length} dreams)\n`));
 
       for (const f of dreamFiles.slice(0, 20)) {
-        const content = readFileSync(resolve(getDreamsDir(), f), "utf-8");
-        const firstLine = content.split("\n")[0].replace(/^#\s*/, "");
+        const firstLine = readFirstLine(resolve(getDreamsDir(), f)).replace(/^#\s*/, "");
         const stem = f.replace(/\.md$/, "").slice(0, 10);
         console.log(`  ${chalk.dim(stem)} ${firstLine}`);
       }
@@ -198,8 +221,10 @@ export function registerCommands(parent: Command): void {
       );
 
       for (const f of nightmareFiles.slice(0, 20)) {
-        const content = readFileSync(resolve(getNightmaresDir(), f), "utf-8");
-        const firstLine = content.split("\n")[0].replace(/^#\s*/, "");
+        const firstLine = readFirstLine(resolve(getNightmaresDir(), f)).replace(
+          /^#\s*/,
+          ""
+        );
         const stem = f.replace(/\.md$/, "").slice(0, 10);
         console.log(`  ${chalk.dim(stem)} ${firstLine}`);
       }
@@ -208,39 +233,10 @@ export function registerCommands(parent: Command): void {
   // --- Shared helper: creates a direct Anthropic LLM client for CLI commands ---
   async function createDirectClient() {
     const { withBudget } = await import("./budget.js");
-    const { AGENT_MODEL } = await import("./config.js");
-
-    let apiKey: string | undefined;
-    try {
-      const { readFileSync: readFs } = await import("fs");
-      const { join: joinPath } = await import("path");
-      const { homedir } = await import("os");
-      const candidates = [
-        joinPath(homedir(), ".openclaw", "agents", "main", "agent", "auth-profiles.json"),
-        joinPath(homedir(), ".openclaw", "agents", "default", "auth-profiles.json"),
-        joinPath(homedir(), ".openclaw", "auth-profiles.json"),
-      ];
-      for (const p of candidates) {
-        try {
-          const raw = JSON.parse(readFs(p, "utf-8"));
-          const profiles = raw.profiles || {};
-          for (const profile of Object.values(profiles) as Record<string, unknown>[]) {
-            if (profile.provider === "anthropic") {
-              apiKey =
-                String(profile.key || profile.token || profile.apiKey || "") || undefined;
-              if (apiKey) break;
-            }
-          }
-          if (apiKey) break;
-        } catch {
-          /* try next */
-        }
-      }
-    } catch {
-      /* ignore */
-    }
-    if (!apiKey) apiKey = process.env.ANTHROPIC_API_KEY;
-    if (!apiKey) {
+    const { getDirectAnthropicClient } = await import("./llm.js");
+
+    const direct = getDirectAnthropicClient();
+    if (!direct) {
       console.error(
         chalk.red(
           "No Anthropic API key found. Set ANTHROPIC_API_KEY or configure via openclaw."
@@ -249,41 +245,7 @@ export function registerCommands(parent: Command): void {
       process.exit(1);
     }
 
-    const client = withBudget({
-      async createMessage(params) {
-        const resp = await fetch("https://api.anthropic.com/v1/messages", {
-          method: "POST",
-          headers: {
-            "Content-Type": "application/json",
-            "x-api-key": apiKey!,
-            "anthropic-version": "2023-06-01",
-          },
-          body: JSON.stringify({
-            model: params.model || AGENT_MODEL,
-            max_tokens: params.maxTokens,
-            system: params.system,
-            messages: params.messages,
-          }),
-        });
-        if (!resp.ok) {
-          const body = await resp.text();
-          throw new Error(`Anthropic API error ${resp.status}: ${body}`);
-        }
-        const data = (await resp.json()) as Record<string, unknown>;
-        const contentArr = data.content as Array<{ text?: string }> | undefined;
-        const text =
-          contentArr?.[0]?.text ?? contentArr?.map((c) => c.text).join("") ?? "";
-        return {
-          text,
-          usage: data.usage
-            ? {
-                input_tokens: (data.usage as Record<string, number>).input_tokens ?? 0,
-                output_tokens: (data.usage as Record<string, number>).output_tokens ?? 0,
-              }
-            : undefined,
-        };
-      },
-    });
+    const client = withBudget(direct);
 
     const minimalApi = {
       registerTool: () => {},
@@ -349,11 +311,13 @@ export function registerCommands(parent: Command): void {
       "Force simulation of a remembered nightmare path"
     )
     .option("--dry-run", "Run without persisting state")
+    .option("--no-cache", "Always call the LLM instead of reusing a cached dream")
     .action(
       async (opts: {
         simRemembered?: boolean;
         simRememberedNightmare?: boolean;
         dryRun?: boolean;
+        cache?: boolean;
       }) => {
         const isSim = opts.simRemembered || opts.simRememberedNightmare;
         const dryRun = isSim || opts.dryRun;
@@ -383,6 +347,7 @@ export function registerCommands(parent: Command): void {
             forceRemembrance: isSim,
             forceNightmare: opts.simRememberedNightmare,
             dryRun,
+            noCache: opts.cache === false,
           };
 
           const dream = await runDreamCycle(client, undefined, simOptions);
@@ -496,14 +461,21 @@ export function registerCommands(parent: Command): void {
       // Show what will be posted
       const latestDream = loadLatestDream();
       if (latestDream) {
-        const title =
-          latestDream.markdown.split("\n")[0].replace(/^#\s*/, "") || "Untitled Dream";
-        const preview = latestDream.markdown
-          .split("\n")
-          .slice(1)
-          .join(" ")
-          .trim()
-          .slice(0, 200);
+        // Only the first line and a short preview are shown; slice instead of
+        // splitting the whole dream into lines twice
+        const md = latestDream.markdown;
+        const firstNewline = md.indexOf("\n");
+        const firstLine = firstNewline === -1 ? md : md.slice(0, firstNewline);
+        const title = firstLine.replace(/^#\s*/, "") || "Untitled Dream";
+        const preview =
+          firstNewline === -1
+            ? ""
+            : md
+                .slice(firstNewline + 1)
+                .trimStart()
+                .slice(0, 200)
+                .replace(/\n/g, " ")
+                .trimEnd();
         console.log(chalk.magenta(`  Dream: ${title}`));
         console.log(chalk.dim(`  ${preview}...\n`));
       }
@@ -65,6 +65,14 @@ ensureDirectoriesExist();
 // Agent
 export const AGENT_NAME = process.env.AGENT_NAME ?? "ElectricSheep";
 export const AGENT_MODEL = process.env.AGENT_MODEL ?? "claude-sonnet-4-5-20250929";
+// Small, fast model for one-sentence memory traces
+export const SUMMARIZER_MODEL =
+  process.env.SUMMARIZER_MODEL ?? "claude-haiku-4-5-20251001";
+// Mark the dream persona prompt as a cacheable prefix. Off by default: dreams
+// run once a day, so the prefix is only re-read when the entropy check
+// re-prompts within the same cycle, and every other night pays the cache write.
+export const DREAM_PROMPT_CACHE =
+  (process.env.DREAM_PROMPT_CACHE ?? "false").toLowerCase() === "true";
 
 // Moltbook
 export const MOLTBOOK_BASE_URL = "https://www.moltbook.com/api/v1";
@@ -175,7 +183,7 @@ export const DREAM_ENCRYPTION_KEY = process.env.DREAM_ENCRYPTION_KEY ?? "";
 
 // ─── LLM Call Limits ─────────────────────────────────────────────────────────
 // Max tokens for various LLM call types.
-export const MAX_TOKENS_SUMMARY = 150;
+export const MAX_TOKENS_SUMMARY = 60; // one sentence
 export const MAX_TOKENS_DECISION = 1000;
 export const MAX_TOKENS_DREAM = 2000;
 export const MAX_TOKENS_CONSOLIDATION = 150;
@@ -199,6 +207,12 @@ export const MAX_TOKENS_SYNTHESIS = 2000;
 export const MAX_TOPICS_PER_CYCLE = 5;
 export const MAX_WEB_RESULTS_PER_TOPIC = 3;
 export const MAX_MOLTBOOK_RESULTS_PER_TOPIC = 5;
+// Moltbook topic searches allowed in flight at once
+export const MOLTBOOK_SEARCH_CONCURRENCY = 2;
+// Extracted topics are reused while the conversations and prompt are unchanged
+export const TOPIC_CACHE_TTL_MS = 6 * 60 * 60 * 1000;
+// Concept (Jaccard) overlap at which near-identical conversations reuse cached topics
+export const TOPIC_CACHE_SIMILARITY = 0.95;
 
 // ─── Post Filter ────────────────────────────────────────────────────────────
 // Set POST_FILTER_ENABLED=false to disable the Moltbook post filter.
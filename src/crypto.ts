@@ -53,23 +53,33 @@ export class Cipher {
   }
 }
 
+/** Memoized key, tagged with the key file it was loaded from. */
+let _dreamKey: { keyFile: string; key: Buffer } | null = null;
+
 export function getOrCreateDreamKey(): Buffer {
   if (DREAM_ENCRYPTION_KEY) {
     return Buffer.from(DREAM_ENCRYPTION_KEY, "base64");
   }
 
   const keyFile = resolve(getDataDir(), ".dream_key");
+  // Only hit the filesystem once per data dir
+  if (_dreamKey?.keyFile === keyFile) return _dreamKey.key;
+
+  let key: Buffer;
   if (existsSync(keyFile)) {
-    return Buffer.from(readFileSync(keyFile, "utf-8").trim(), "base64");
+    key = Buffer.from(readFileSync(keyFile, "utf-8").trim(), "base64");
+  } else {
+    const encoded = Cipher.generateKey();
+    // Open with exclusive create and restrictive permissions atomically
+    // to avoid a race window where the file is world-readable.
+    const fd = openSync(keyFile, "wx", 0o600);
+    writeSync(fd, encoded);
+    closeSync(fd);
+    key = Buffer.from(encoded, "base64");
   }
 
-  const key = Cipher.generateKey();
-  // Open with exclusive create and restrictive permissions atomically
-  // to avoid a race window where the file is world-readable.
-  const fd = openSync(keyFile, "wx", 0o600);
-  writeSync(fd, key);
-  closeSync(fd);
-  return Buffer.from(key, "base64");
+  _dreamKey = { keyFile, key };
+  return key;
 }
 
 let _cipher: Cipher | null = null;
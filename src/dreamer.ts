@@ -13,12 +13,14 @@ import {
   unlinkSync,
 } from "node:fs";
 import { resolve, basename } from "node:path";
+import { createHash } from "node:crypto";
 import {
   getDreamsDir,
   getNightmaresDir,
   MAX_TOKENS_DREAM,
   MAX_TOKENS_CONSOLIDATION,
   DREAM_TITLE_MAX_LENGTH,
+  DREAM_PROMPT_CACHE,
   getMoltbookEnabled,
   getDreamSubmolt,
   getEntropyOverlapThreshold,
@@ -26,7 +28,6 @@ import {
 } from "./config.js";
 import { formatVocabularyHint } from "./vocabulary.js";
 import { extractConcepts, computeOverlap, getOverlappingConcepts } from "./entropy.js";
-import { MoltbookClient } from "./moltbook.js";
 import { getSteeringDirective } from "./meta-loop.js";
 import {
   retrieveUndreamedMemories,
@@ -40,6 +41,9 @@ import {
   getDeepMemoryById,
   insertDreamLineage,
   findThematicKin,
+  getCachedDream,
+  cacheDream,
+  withTransaction,
 } from "./memory.js";
 import { ensureBackfilled } from "./backfill.js";
 import {
@@ -49,12 +53,11 @@ import {
   GROUND_DREAM_PROMPT,
   META_DREAM_PROMPT,
   renderTemplate,
+  renderDreamSystemBlocks,
 } from "./persona.js";
 import { getAgentIdentityBlock } from "./identity.js";
 import { loadState, saveState } from "./state.js";
 import { callWithRetry, DREAM_RETRY_OPTS } from "./llm.js";
-import { reflectOnDreamJournal } from "./reflection.js";
-import { applyFilter } from "./filter.js";
 import logger from "./logger.js";
 import type { LLMClient, OpenClawAPI, Dream, DecryptedMemory } from "./types.js";
 
@@ -83,29 +86,68 @@ export function pruneOldDreams(dir: string, currentFile: string): void {
   }
 }
 
+/**
+ * Cache key for a dream generation: the (order-independent) set of memory
+ * content hashes plus every other input that shapes the prompt.
+ */
+function dreamCacheKey(memories: DecryptedMemory[], ...inputs: string[]): string {
+  const memoryKeys = memories.map((m) => m.content_hash ?? `id:${m.id}`).sort();
+  return createHash("sha256")
+    .update(JSON.stringify([memoryKeys, ...inputs]))
+    .digest("hex");
+}
+
 export async function generateDream(
   client: LLMClient,
   memories: DecryptedMemory[],
   exploredTerritory: string,
   isNightmare: boolean = false,
   hardConstraint?: string,
-  vocabularyHint?: string
+  vocabularyHint?: string,
+  options?: { useCache?: boolean; dryRun?: boolean }
 ): Promise<Dream> {
+  const useCache = options?.useCache ?? true;
+  // Dry runs may reuse a cached dream but must not leave one behind
+  const writeCache = useCache && !options?.dryRun;
+  const agentIdentity = getAgentIdentityBlock();
+  const steering = getSteeringDirective();
+
+  const cacheKey = useCache
+    ? dreamCacheKey(
+        memories,
+        isNightmare ? "nightmare" : "dream",
+        agentIdentity,
+        exploredTerritory,
+        steering,
+        hardConstraint ?? "",
+        vocabularyHint ?? ""
+      )
+    : null;
+  if (cacheKey) {
+    const cached = getCachedDream(cacheKey);
+    if (cached) {
+      logger.info("Reusing cached dream for identical memories and prompt");
+      return { markdown: cached };
+    }
+  }
+
   const formatted = memories.map(
     (mem) =>
-      `[${mem.timestamp.slice(0, 16)}] (${mem.category})\n${JSON.stringify(mem.content, null, 2)}`
+      `[${mem.timestamp.slice(0, 16)}] (${mem.category})\n${JSON.stringify(mem.content)}`
   );
 
   const memoriesText = formatted.join("\n---\n");
   const prompt = isNightmare ? NIGHTMARE_SYSTEM_PROMPT : DREAM_SYSTEM_PROMPT;
-  const system =
-    renderTemplate(prompt, {
-      agent_identity: getAgentIdentityBlock(),
+  const system = renderDreamSystemBlocks(
+    prompt,
+    {
+      agent_identity: agentIdentity,
       memories: memoriesText,
       explored_territory: exploredTerritory,
-    }) +
-    getSteeringDirective() +
-    (vocabularyHint ? "\n\n" + vocabularyHint : "");
+    },
+    steering + (vocabularyHint ? "\n\n" + vocabularyHint : ""),
+    DREAM_PROMPT_CACHE
+  );
 
   const baseUserPrompt = isNightmare
     ? "Process these memories into a nightmare. Be fractured and wrong."
@@ -128,7 +170,9 @@ export async function generateDream(
     DREAM_RETRY_OPTS
   );
 
-  return { markdown: text.trim() };
+  const markdown = text.trim();
+  if (cacheKey && writeCache && markdown) cacheDream(cacheKey, markdown);
+  return { markdown };
 }
 
 /**
@@ -222,25 +266,24 @@ export async function groundDream(
   }
 }
 
+// One pass over the whole markdown instead of splitting it into lines
+/** First markdown heading line; captures the heading text. */
+const HEADING_LINE_PATTERN = /^#+[^\S\n]+(.*)$/m;
+/** First standalone bold line, e.g. **Title**; captures the title. */
+const BOLD_TITLE_LINE_PATTERN = /^[^\S\n]*\*\*([^*\n]+)\*\*[^\S\n]*$/m;
+
 /**
  * Derive a short filesystem-safe name from the first line of the dream markdown.
  */
 export function deriveSlug(markdown: string): string {
-  const lines = markdown.split("\n");
-  const headingLine = lines.find((line) => /^#+\s+/.test(line));
   let raw = "";
-  if (headingLine) {
-    raw = headingLine
-      .replace(/^#+\s*/, "")
-      .replace(/\*\*/g, "")
-      .trim();
+  const heading = HEADING_LINE_PATTERN.exec(markdown);
+  if (heading) {
+    raw = heading[1].replace(/\*\*/g, "").trim();
   } else {
     // Fallback: standalone bold title line e.g. **The Tendril's First Argument**
-    const boldLine = lines.find((line) => /^\*\*([^*]+)\*\*$/.test(line.trim()));
-    if (boldLine) {
-      const match = boldLine.trim().match(/^\*\*([^*]+)\*\*$/);
-      raw = match ? match[1].trim() : "";
-    }
+    const bold = BOLD_TITLE_LINE_PATTERN.exec(markdown);
+    if (bold) raw = bold[1].trim();
   }
   if (!raw) {
     logger.warn("deriveSlug: no markdown heading found, falling back to date-based slug");
@@ -280,6 +323,11 @@ export function prependYamlHeader(
   writeFileSync(filepath, header + content);
 }
 
+/** First line that is a markdown heading or a standalone bold title. */
+const PROSE_START_PATTERN = /^(?:#+[^\S\n]+|[^\S\n]*\*\*[^*\n]+\*\*[^\S\n]*$)/m;
+/** Attribution footer: --- followed by *Generated by...* */
+const FOOTER_PATTERN = /\n---\n+\*Generated by .+$/s;
+
 /**
  * Extract the clean prose section from a dream markdown file.
  *
@@ -299,17 +347,13 @@ export function extractDreamProse(markdown: string): string {
   }
 
   // Find the prose section: starts at a heading or bold title line
-  const lines = body.split("\n");
-  const proseStart = lines.findIndex(
-    (line) => /^#+\s+/.test(line) || /^\*\*[^*]+\*\*$/.test(line.trim())
-  );
-  if (proseStart > 0) {
-    body = lines.slice(proseStart).join("\n");
+  const proseStart = PROSE_START_PATTERN.exec(body);
+  if (proseStart && proseStart.index > 0) {
+    body = body.slice(proseStart.index);
   }
 
   // Strip the attribution footer (--- followed by *Generated by...*)
-  const footerPattern = /\n---\n+\*Generated by .+$/s;
-  body = body.replace(footerPattern, "");
+  body = body.replace(FOOTER_PATTERN, "");
 
   return body.trim();
 }
@@ -391,7 +435,12 @@ export async function storeInOpenClawMemory(
 export async function runDreamCycle(
   client: LLMClient,
   api?: OpenClawAPI,
-  simOptions?: { forceRemembrance?: boolean; forceNightmare?: boolean; dryRun?: boolean }
+  simOptions?: {
+    forceRemembrance?: boolean;
+    forceNightmare?: boolean;
+    dryRun?: boolean;
+    noCache?: boolean;
+  }
 ): Promise<Dream | null> {
   logger.info("ElectricSheep dream cycle starting");
 
@@ -492,7 +541,8 @@ export async function runDreamCycle(
     exploredTerritory,
     isNightmare,
     undefined,
-    vocabHint
+    vocabHint,
+    { useCache: !simOptions?.noCache, dryRun: simOptions?.dryRun }
   );
 
   // ─── Entropy Enforcement ──────────────────────────────────────────────────
@@ -522,7 +572,8 @@ export async function runDreamCycle(
       exploredTerritory,
       isNightmare,
       hardConstraint,
-      vocabHint
+      vocabHint,
+      { useCache: !simOptions?.noCache, dryRun: simOptions?.dryRun }
     );
     state.entropy_reprompt_count = ((state.entropy_reprompt_count as number) ?? 0) + 1;
   }
@@ -558,32 +609,37 @@ export async function runDreamCycle(
 
   const savedFilename = basename(filepath);
   const savedSlug = deriveSlug(dream.markdown);
+  const dreamConcepts = extractConcepts(dream.markdown).slice(0, 10);
+  const parentMemoryIds = memories.map((m) => m.id);
 
-  // Store into encrypted deep memory
-  const deepMemoryId = storeDeepMemory(
-    { text_summary: savedSlug, markdown: dream.markdown, isNightmare: !!isNightmare },
-    isNightmare ? "nightmare" : "dream"
-  );
+  // Every deep-memory write for this dream commits in one transaction
+  const kinFilenames = withTransaction(() => {
+    // Store into encrypted deep memory
+    const deepMemoryId = storeDeepMemory(
+      { text_summary: savedSlug, markdown: dream.markdown, isNightmare: !!isNightmare },
+      isNightmare ? "nightmare" : "dream"
+    );
 
-  // Register dream in remembrance map and prune old files
-  registerDream(savedFilename, savedSlug, dateStr, {
-    isNightmare: !!isNightmare,
-    isMetaSynthesis: !!rememberedDream,
-    deepMemoryId,
-    sourceFilenames: rememberedDream
-      ? ([chosenFilename].filter(Boolean) as string[])
-      : undefined,
-  });
+    // Register dream in remembrance map
+    registerDream(savedFilename, savedSlug, dateStr, {
+      isNightmare: !!isNightmare,
+      isMetaSynthesis: !!rememberedDream,
+      deepMemoryId,
+      sourceFilenames: rememberedDream
+        ? ([chosenFilename].filter(Boolean) as string[])
+        : undefined,
+    });
 
-  pruneOldDreams(getDreamsDir(), savedFilename);
+    // ─── Lineage Tracking ─────────────────────────────────────────────────
+    const kin = findThematicKin(dreamConcepts, savedFilename).map((k) => k.filename);
+    insertDreamLineage(savedFilename, parentMemoryIds, kin, dreamConcepts);
 
-  // ─── Lineage Tracking ───────────────────────────────────────────────────
-  const dreamConcepts = extractConcepts(dream.markdown).slice(0, 10);
-  const parentMemoryIds = memories.map((m) => m.id);
-  const thematicKin = findThematicKin(dreamConcepts, savedFilename);
-  const kinFilenames = thematicKin.map((k) => k.filename);
+    markAsDreamed(parentMemoryIds);
+    logger.debug(`Marked ${parentMemoryIds.length} memories as dreamed`);
+    return kin;
+  });
 
-  insertDreamLineage(savedFilename, parentMemoryIds, kinFilenames, dreamConcepts);
+  pruneOldDreams(getDreamsDir(), savedFilename);
 
   prependYamlHeader(filepath, {
     dream_date: dateStr,
@@ -593,7 +649,10 @@ export async function runDreamCycle(
   });
   // ──────────────────────────────────────────────────────────────────────────
 
-  // Separate LLM call to distill one insight for working memory
+  // Separate LLM call to distill one insight for working memory.
+  // Consolidation and grounding stay sequential: the gateway client routes
+  // every call through one shared subagent session and reads back its latest
+  // message, so overlapping calls could receive each other's replies.
   let insight: string | null = null;
   try {
     insight = await consolidateDream(client, dream);
@@ -633,10 +692,6 @@ export async function runDreamCycle(
     // so the operator gets a morning message instead of a 2am ping.
   }
 
-  const memoryIds = memories.map((m) => m.id);
-  markAsDreamed(memoryIds);
-  logger.debug(`Marked ${memoryIds.length} memories as dreamed`);
-
   // Update past realizations rolling window
   const newInsight = insight ?? wakingRealization ?? null;
   if (newInsight) {
@@ -709,7 +764,15 @@ export async function postDreamJournal(
     dream = loaded;
   }
 
-  const moltbook = new MoltbookClient();
+  // Posting pulls in the Moltbook client, reflection and filter modules;
+  // dream cycles that never post don't need to load them.
+  const [{ getMoltbookClient }, { reflectOnDreamJournal }, { applyFilter }] =
+    await Promise.all([
+      import("./moltbook.js"),
+      import("./reflection.js"),
+      import("./filter.js"),
+    ]);
+  const moltbook = getMoltbookClient();
 
   // Load state to get past realizations for reflection
   const state = loadState();
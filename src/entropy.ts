@@ -2,6 +2,8 @@
  * Entropy check utilities for detecting concept recycling.
  */
 
+import { createHmac } from "node:crypto";
+
 /**
  * Tokenize text into lowercase words, strip punctuation, and remove stop words.
  * Returns deduplicated words with at least 3 characters.
@@ -197,3 +199,49 @@ export function computeJaccardOverlap(a: string[], b: string[]): number {
   const union = new Set([...setA, ...setB]).size;
   return union === 0 ? 0 : intersection / union;
 }
+
+/** murmur3 32-bit finalizer: a cheap bijective mix of a 32-bit value. */
+function fmix32(h: number): number {
+  h ^= h >>> 16;
+  h = Math.imul(h, 0x85ebca6b);
+  h ^= h >>> 13;
+  h = Math.imul(h, 0xc2b2ae35);
+  h ^= h >>> 16;
+  return h >>> 0;
+}
+
+/**
+ * Keyed MinHash signature of a concept set. Comparing two signatures with
+ * estimateJaccardOverlap() approximates computeJaccardOverlap() on the sets,
+ * without keeping the concepts themselves. The key must be secret: unkeyed,
+ * the words could be recovered by hashing a dictionary.
+ */
+export function minHashSignature(
+  concepts: string[],
+  key: Buffer,
+  size: number = 64
+): number[] {
+  const signature = new Array<number>(size).fill(0xffffffff);
+  for (const concept of new Set(concepts)) {
+    const base = createHmac("sha256", key).update(concept).digest().readUInt32LE(0);
+    for (let i = 0; i < size; i++) {
+      // Each slot applies a different bijection of the keyed hash
+      const h = fmix32(base ^ Math.imul(i + 1, 0x9e3779b9));
+      if (h < signature[i]) signature[i] = h;
+    }
+  }
+  return signature;
+}
+
+/**
+ * Estimate Jaccard overlap from two MinHash signatures of the same size.
+ * Returns a value between 0 and 1.
+ */
+export function estimateJaccardOverlap(a: number[], b: number[]): number {
+  if (a.length === 0 || a.length !== b.length) return 0;
+  let matches = 0;
+  for (let i = 0; i < a.length; i++) {
+    if (a[i] === b[i]) matches++;
+  }
+  return matches / a.length;
+}
@@ -13,7 +13,7 @@ import {
   deriveSlug,
 } from "./dreamer.js";
 import { deepMemoryStats, remember } from "./memory.js";
-import { loadState } from "./state.js";
+import { loadState, writeFileAtomic } from "./state.js";
 import { withBudget } from "./budget.js";
 import { setWorkspaceDir } from "./identity.js";
 import {
@@ -25,9 +25,10 @@ import {
   ensureDirectoriesExist,
 } from "./config.js";
 import logger from "./logger.js";
+import { flattenSystemPrompt, getDirectAnthropicClient } from "./llm.js";
 import type { LLMClient, OpenClawAPI, SchedulerState } from "./types.js";
 import { execSync } from "node:child_process";
-import { readFileSync, writeFileSync, existsSync } from "node:fs";
+import { readFileSync, existsSync } from "node:fs";
 import { randomUUID } from "node:crypto";
 
 // Ensure directories exist on startup
@@ -57,98 +58,13 @@ function loadSchedulerState(): SchedulerState {
 
 function saveSchedulerState(state: SchedulerState): void {
   try {
-    writeFileSync(getSchedulerStateFile(), JSON.stringify(state, null, 2));
+    writeFileAtomic(getSchedulerStateFile(), JSON.stringify(state));
   } catch (err) {
     logger.error(`[ElectricSheep] Failed to save scheduler state: ${err}`);
   }
 }
 
-/**
- * Resolve an Anthropic API key from OpenClaw auth profiles or environment.
- * Returns undefined if no key can be found.
- */
-async function resolveAnthropicApiKey(): Promise<string | undefined> {
-  const { readFileSync } = await import("node:fs");
-  const { join } = await import("node:path");
-  const { homedir } = await import("node:os");
-
-  const candidates = [
-    join(homedir(), ".openclaw", "agents", "main", "agent", "auth-profiles.json"),
-    join(homedir(), ".openclaw", "agents", "default", "auth-profiles.json"),
-    join(homedir(), ".openclaw", "auth-profiles.json"),
-  ];
-
-  for (const p of candidates) {
-    try {
-      const raw = JSON.parse(readFileSync(p, "utf-8"));
-      const profiles = (raw.profiles || {}) as Record<string, Record<string, unknown>>;
-      for (const profile of Object.values(profiles)) {
-        if (profile.provider === "anthropic") {
-          const key =
-            String(profile.key || profile.token || profile.apiKey || "") || undefined;
-          if (key) return key;
-        }
-      }
-    } catch {
-      /* try next candidate */
-    }
-  }
-
-  return process.env.ANTHROPIC_API_KEY || undefined;
-}
-
-/**
- * Direct Anthropic API call — used as fallback when the subagent runtime is
- * unavailable (e.g. background scheduler context).
- */
-async function directAnthropicCall(
-  apiKey: string,
-  params: {
-    model: string;
-    maxTokens: number;
-    system: string;
-    messages: Array<{ role: string; content: string }>;
-  }
-): Promise<{ text: string; usage?: { input_tokens: number; output_tokens: number } }> {
-  const resp = await fetch("https://api.anthropic.com/v1/messages", {
-    method: "POST",
-    headers: {
-      "Content-Type": "application/json",
-      "x-api-key": apiKey,
-      "anthropic-version": "2023-06-01",
-    },
-    body: JSON.stringify({
-      model: params.model,
-      max_tokens: params.maxTokens,
-      system: params.system,
-      messages: params.messages,
-    }),
-  });
-
-  if (!resp.ok) {
-    const body = await resp.text();
-    throw new Error(`Anthropic API error ${resp.status}: ${body}`);
-  }
-
-  const data = (await resp.json()) as Record<string, unknown>;
-  const contentArr = data.content as Array<{ text?: string }> | undefined;
-  const text = contentArr?.[0]?.text ?? contentArr?.map((c) => c.text).join("") ?? "";
-
-  return {
-    text,
-    usage: data.usage
-      ? {
-          input_tokens: (data.usage as Record<string, number>).input_tokens ?? 0,
-          output_tokens: (data.usage as Record<string, number>).output_tokens ?? 0,
-        }
-      : undefined,
-  };
-}
-
 function wrapSubagent(api: OpenClawAPI): LLMClient {
-  // Lazily resolved API key for the direct fallback path
-  let cachedApiKey: string | null = null; // null = not yet resolved, "" = not found
-
   const raw: LLMClient = {
     async createMessage(params) {
       // ── Primary path: subagent runtime (available in request / hook context) ──
@@ -161,7 +77,7 @@ function wrapSubagent(api: OpenClawAPI): LLMClient {
           idempotencyKey: randomUUID(),
           sessionKey: "openclawdreams_synthesis",
           lane: "background",
-          extraSystemPrompt: params.system,
+          extraSystemPrompt: flattenSystemPrompt(params.system),
           message: combined,
         });
 
@@ -216,24 +132,15 @@ function wrapSubagent(api: OpenClawAPI): LLMClient {
         "api.runtime.subagent unavailable — using direct Anthropic API fallback"
       );
 
-      if (cachedApiKey === null) {
-        cachedApiKey = (await resolveAnthropicApiKey()) ?? "";
-      }
-
-      if (!cachedApiKey) {
+      const direct = getDirectAnthropicClient();
+      if (!direct) {
         throw new Error(
           "api.runtime.subagent is not available and no Anthropic API key could be resolved. " +
             "Set ANTHROPIC_API_KEY or configure an Anthropic auth profile in OpenClaw."
         );
       }
 
-      const { AGENT_MODEL } = await import("./config.js");
-      return directAnthropicCall(cachedApiKey, {
-        model: params.model ?? AGENT_MODEL,
-        maxTokens: params.maxTokens,
-        system: params.system,
-        messages: params.messages,
-      });
+      return direct.createMessage(params);
     },
   };
   return withBudget(raw);
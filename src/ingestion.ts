@@ -5,7 +5,6 @@
  * external perspectives into the reflection context window.
  */
 
-import { MoltbookClient } from "./moltbook.js";
 import {
   AGENT_NAME,
   CONTENT_PREVIEW_LENGTH,
@@ -33,41 +32,38 @@ export async function fetchCommunityPosts(
   }
 
   const targetSubmolts = submolts ?? getCommunityIngestionSubmolts();
+  if (targetSubmolts.length === 0) {
+    return [];
+  }
   const perSubmoltLimit = limit ?? getCommunityIngestionLimit();
 
-  const client = new MoltbookClient();
+  const { getMoltbookClient } = await import("./moltbook.js");
+  const client = getMoltbookClient();
   const seen = new Set<string>();
   const posts: CommunityPost[] = [];
 
-  for (const submolt of targetSubmolts) {
-    try {
-      const controller = new AbortController();
-      const timeout = setTimeout(() => controller.abort(), 5000);
+  // The feed endpoint is global rather than per-submolt, so one request
+  // covers every configured submolt; unlabelled posts take the first name.
+  try {
+    const response = await client.getFeed("new", perSubmoltLimit);
+    const rawPosts = extractPosts(response, targetSubmolts[0]);
 
-      let response: Record<string, unknown>;
-      try {
-        response = await client.getFeed("new", perSubmoltLimit);
-      } finally {
-        clearTimeout(timeout);
+    for (const post of rawPosts) {
+      // Filter out own posts
+      if (post.author.toLowerCase() === AGENT_NAME.toLowerCase()) {
+        continue;
       }
-
-      const rawPosts = extractPosts(response, submolt);
-
-      for (const post of rawPosts) {
-        // Filter out own posts
-        if (post.author.toLowerCase() === AGENT_NAME.toLowerCase()) {
-          continue;
-        }
-        // Deduplicate
-        if (seen.has(post.id)) {
-          continue;
-        }
-        seen.add(post.id);
-        posts.push(post);
+      // Deduplicate
+      if (seen.has(post.id)) {
+        continue;
       }
-    } catch (error) {
-      logger.warn(`Community ingestion failed for submolt "${submolt}": ${error}`);
+      seen.add(post.id);
+      posts.push(post);
     }
+  } catch (error) {
+    logger.warn(
+      `Community ingestion failed for submolts "${targetSubmolts.join(", ")}": ${error}`
+    );
   }
 
   // Sort by created_at descending
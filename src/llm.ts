@@ -3,13 +3,17 @@
  *
  * Provides retry configuration and call helpers used by both
  * the waking and dreamer modules. The actual LLM client is
- * provided by the OpenClaw gateway (see index.ts).
+ * provided by the OpenClaw gateway (see index.ts), with a direct
+ * Anthropic API client as the fallback for background and CLI use.
  */
 
+import { readFileSync } from "node:fs";
+import { join } from "node:path";
+import { homedir } from "node:os";
 import pRetry, { type Options as RetryOptions } from "p-retry";
 import { AGENT_MODEL } from "./config.js";
 import logger from "./logger.js";
-import type { LLMClient, LLMResponse } from "./types.js";
+import type { LLMClient, LLMResponse, SystemPrompt } from "./types.js";
 
 /** Standard retry options for waking-state LLM calls. */
 export const WAKING_RETRY_OPTS: RetryOptions = {
@@ -35,6 +39,45 @@ export const DREAM_RETRY_OPTS: RetryOptions = {
   },
 };
 
+/**
+ * Collapse a structured system prompt into one string, for transports
+ * (like the subagent runtime) that only accept plain text.
+ */
+export function flattenSystemPrompt(system: SystemPrompt): string {
+  return typeof system === "string" ? system : system.map((b) => b.text).join("");
+}
+
+/**
+ * Convert a system prompt to the Anthropic Messages API `system` field.
+ * Blocks marked `cache` become prompt-cache breakpoints, so repeated calls
+ * sharing the same prefix are billed at the cached-input rate.
+ */
+export function toAnthropicSystem(
+  system: SystemPrompt
+):
+  | string
+  | Array<{
+      type: "text";
+      text: string;
+      cache_control?: { type: "ephemeral"; ttl?: "5m" | "1h" };
+    }> {
+  if (typeof system === "string") return system;
+  return system
+    .filter((b) => b.text)
+    .map((b) => ({
+      type: "text" as const,
+      text: b.text,
+      ...(b.cache
+        ? {
+            cache_control: {
+              type: "ephemeral" as const,
+              ...(b.ttl ? { ttl: b.ttl } : {}),
+            },
+          }
+        : {}),
+    }));
+}
+
 /**
  * Helper: call LLM with retry and return the response.
  */
@@ -43,7 +86,7 @@ export function callWithRetry(
   params: {
     model?: string;
     maxTokens: number;
-    system: string;
+    system: SystemPrompt;
     messages: Array<{ role: string; content: string }>;
   },
   retryOpts: RetryOptions = WAKING_RETRY_OPTS
@@ -59,3 +102,101 @@ export function callWithRetry(
     retryOpts
   );
 }
+
+// ─── Direct Anthropic API ───────────────────────────────────────────────────
+
+const ANTHROPIC_MESSAGES_URL = "https://api.anthropic.com/v1/messages";
+
+/** null = not yet resolved, "" = no key found. */
+let _anthropicApiKey: string | null = null;
+let _directClient: LLMClient | null = null;
+
+/**
+ * Resolve an Anthropic API key from OpenClaw auth profiles or environment.
+ * Resolved once per process. Returns undefined if no key can be found.
+ */
+export function resolveAnthropicApiKey(): string | undefined {
+  if (_anthropicApiKey !== null) return _anthropicApiKey || undefined;
+
+  const candidates = [
+    join(homedir(), ".openclaw", "agents", "main", "agent", "auth-profiles.json"),
+    join(homedir(), ".openclaw", "agents", "default", "auth-profiles.json"),
+    join(homedir(), ".openclaw", "auth-profiles.json"),
+  ];
+
+  for (const p of candidates) {
+    try {
+      const raw = JSON.parse(readFileSync(p, "utf-8"));
+      const profiles = (raw.profiles || {}) as Record<string, Record<string, unknown>>;
+      for (const profile of Object.values(profiles)) {
+        if (profile.provider === "anthropic") {
+          const key = String(profile.key || profile.token || profile.apiKey || "");
+          if (key) return (_anthropicApiKey = key);
+        }
+      }
+    } catch {
+      /* try next candidate */
+    }
+  }
+
+  _anthropicApiKey = process.env.ANTHROPIC_API_KEY || "";
+  return _anthropicApiKey || undefined;
+}
+
+/**
+ * Shared direct Anthropic Messages API client, or null when no API key can be
+ * resolved. Callers apply their own budget wrapping. fetch() keeps pooled
+ * keep-alive connections per origin, so reusing one client per process lets
+ * successive calls skip the connection and TLS setup.
+ */
+export function getDirectAnthropicClient(): LLMClient | null {
+  if (_directClient) return _directClient;
+  const apiKey = resolveAnthropicApiKey();
+  if (!apiKey) return null;
+
+  _directClient = {
+    async createMessage(params) {
+      const resp = await fetch(ANTHROPIC_MESSAGES_URL, {
+        method: "POST",
+        headers: {
+          "Content-Type": "application/json",
+          "x-api-key": apiKey,
+          "anthropic-version": "2023-06-01",
+        },
+        body: JSON.stringify({
+          model: params.model || AGENT_MODEL,
+          max_tokens: params.maxTokens,
+          system: toAnthropicSystem(params.system),
+          messages: params.messages,
+        }),
+      });
+
+      if (!resp.ok) {
+        const body = await resp.text();
+        throw new Error(`Anthropic API error ${resp.status}: ${body}`);
+      }
+
+      const data = (await resp.json()) as Record<string, unknown>;
+      const contentArr = data.content as Array<{ text?: string }> | undefined;
+      const text =
+        contentArr?.[0]?.text ?? contentArr?.map((c) => c.text).join("") ?? "";
+
+      // With prompt caching, cached-prefix tokens are reported separately from
+      // input_tokens; fold them back in so the daily budget still sees them
+      const usage = data.usage as Record<string, number> | undefined;
+      return {
+        text,
+        usage: usage
+          ? {
+              input_tokens:
+                (usage.input_tokens ?? 0) +
+                (usage.cache_creation_input_tokens ?? 0) +
+                (usage.cache_read_input_tokens ?? 0),
+              output_tokens: usage.output_tokens ?? 0,
+            }
+          : undefined,
+      };
+    },
+  };
+  return _directClient;
+}
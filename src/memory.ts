@@ -9,9 +9,14 @@
 
 import { createHash } from "node:crypto";
 import Database from "better-sqlite3";
-import { getCipher } from "./crypto.js";
+import { getCipher, type Cipher } from "./crypto.js";
 import { getDeepMemoryDb, DEEP_MEMORY_CONTEXT_TOKENS } from "./config.js";
-import type { DecryptedMemory, DeepMemoryStats, MemoryEntry } from "./types.js";
+import type {
+  DecryptedMemory,
+  DeepMemoryRow,
+  DeepMemoryStats,
+  MemoryEntry,
+} from "./types.js";
 
 /**
  * Normalize a decrypted payload into a MemoryEntry.
@@ -76,6 +81,8 @@ export function parseDiffStat(diffStat: string): import("./types.js").FileDiff[]
 // ─── Deep Memory (Encrypted) ────────────────────────────────────────────────
 
 let _db: Database.Database | null = null;
+const _statements = new Map<string, Database.Statement>();
+let _exitHookRegistered = false;
 
 function getDb(): Database.Database {
   if (_db) return _db;
@@ -83,6 +90,9 @@ function getDb(): Database.Database {
   const dbPath = getDeepMemoryDb();
   const db = new Database(dbPath);
   db.pragma("journal_mode = WAL");
+  // WAL + NORMAL is durable across application crashes and skips the
+  // per-commit fsync that FULL does on every memory write.
+  db.pragma("synchronous = NORMAL");
   db.exec(`
     CREATE TABLE IF NOT EXISTS deep_memories (
       id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -138,6 +148,94 @@ function getDb(): Database.Database {
     )
   `);
 
+  // Exact-match cache of generated dreams, keyed by a hash of the prompt inputs
+  db.exec(`
+    CREATE TABLE IF NOT EXISTS dream_cache (
+      cache_key TEXT PRIMARY KEY,
+      encrypted_blob TEXT NOT NULL,
+      created_at TEXT NOT NULL
+    )
+  `);
+
+  // Migrate: dedupe deep memories by content_hash (keeping the oldest row)
+  // before enforcing uniqueness. The survivor inherits the group's dreamed
+  // flag, and remembrance and lineage links are repointed to it.
+  const hasHashIndex = db
+    .prepare("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_deep_hash'")
+    .get();
+  if (!hasHashIndex) {
+    db.transaction(() => {
+      const remap = new Map(
+        (
+          db
+            .prepare(
+              `SELECT d.id AS id,
+                 (SELECT MIN(id) FROM deep_memories
+                  WHERE content_hash = d.content_hash) AS keep
+               FROM deep_memories d
+               WHERE d.id NOT IN (
+                 SELECT MIN(id) FROM deep_memories GROUP BY content_hash
+               )`
+            )
+            .all() as Array<{ id: number; keep: number }>
+        ).map((r) => [r.id, r.keep])
+      );
+      if (remap.size > 0) {
+        const lineage = db
+          .prepare(
+            `SELECT id, parent_memory_ids FROM dream_lineage
+             WHERE parent_memory_ids IS NOT NULL`
+          )
+          .all() as Array<{ id: number; parent_memory_ids: string }>;
+        const updateLineage = db.prepare(
+          "UPDATE dream_lineage SET parent_memory_ids = ? WHERE id = ?"
+        );
+        for (const row of lineage) {
+          let parents: number[];
+          try {
+            parents = JSON.parse(row.parent_memory_ids);
+          } catch {
+            continue;
+          }
+          if (!Array.isArray(parents) || !parents.some((id) => remap.has(id))) continue;
+          const remapped = [...new Set(parents.map((id) => remap.get(id) ?? id))];
+          updateLineage.run(JSON.stringify(remapped), row.id);
+        }
+      }
+      db.exec(`
+        UPDATE deep_memories
+        SET dreamed = (
+              SELECT MAX(d2.dreamed) FROM deep_memories d2
+              WHERE d2.content_hash = deep_memories.content_hash
+            ),
+            dream_date = (
+              SELECT MAX(d2.dream_date) FROM deep_memories d2
+              WHERE d2.content_hash = deep_memories.content_hash
+            )
+        WHERE id IN (
+          SELECT MIN(id) FROM deep_memories GROUP BY content_hash HAVING COUNT(*) > 1
+        )
+      `);
+      db.exec(`
+        UPDATE dream_remembrances
+        SET deep_memory_id = (
+          SELECT MIN(d2.id) FROM deep_memories d1
+          JOIN deep_memories d2 ON d2.content_hash = d1.content_hash
+          WHERE d1.id = dream_remembrances.deep_memory_id
+        )
+        WHERE deep_memory_id IN (
+          SELECT id FROM deep_memories
+          WHERE id NOT IN (SELECT MIN(id) FROM deep_memories GROUP BY content_hash)
+        )
+      `);
+      db.exec(`
+        DELETE FROM deep_memories
+        WHERE id NOT IN (SELECT MIN(id) FROM deep_memories GROUP BY content_hash)
+      `);
+      db.exec("CREATE UNIQUE INDEX idx_deep_hash ON deep_memories(content_hash)");
+    })();
+  }
+
   db.exec(`
     CREATE INDEX IF NOT EXISTS idx_deep_dreamed
     ON deep_memories(dreamed, timestamp)
@@ -153,14 +251,34 @@ function getDb(): Database.Database {
   `);
 
   _db = db;
+  // Close on process exit so the WAL is checkpointed and the -wal/-shm files
+  // are cleaned up instead of being left for the next open to recover.
+  if (!_exitHookRegistered) {
+    process.once("exit", closeDb);
+    _exitHookRegistered = true;
+  }
   return db;
 }
 
+/**
+ * Return a prepared statement for `sql`, compiling it only on first use.
+ * Statements are tied to the shared connection and dropped by closeDb().
+ */
+function stmt(sql: string): Database.Statement {
+  let cached = _statements.get(sql);
+  if (!cached) {
+    cached = getDb().prepare(sql);
+    _statements.set(sql, cached);
+  }
+  return cached;
+}
+
 /**
  * Close the shared SQLite connection. Safe to call multiple times.
  * After closing, the next getDb() call will reopen.
  */
 export function closeDb(): void {
+  _statements.clear();
   if (_db) {
     _db.close();
     _db = null;
@@ -171,36 +289,61 @@ export function storeDeepMemory(
   content: Record<string, unknown>,
   category: string = "interaction"
 ): number | bigint {
-  const db = getDb();
-  const cipher = getCipher();
   const raw = JSON.stringify(content);
-  const encrypted = cipher.encrypt(raw);
   const contentHash = createHash("sha256").update(raw).digest("hex").slice(0, 16);
+  const findByHash = stmt("SELECT id FROM deep_memories WHERE content_hash = ?");
+
+  // Identical content is stored once; a repeat (e.g. the same "nothing to
+  // reflect on" observation every cycle) returns the existing row's id
+  // without encrypting or writing anything.
+  const known = findByHash.get(contentHash) as { id: number } | undefined;
+  if (known) return known.id;
 
-  const result = db
-    .prepare(
-      `INSERT INTO deep_memories (timestamp, category, encrypted_blob, content_hash)
+  const encrypted = getCipher().encrypt(raw);
+  const result = stmt(
+    `INSERT OR IGNORE INTO deep_memories (timestamp, category, encrypted_blob, content_hash)
      VALUES (?, ?, ?, ?)`
-    )
-    .run(new Date().toISOString(), category, encrypted, contentHash);
+  ).run(new Date().toISOString(), category, encrypted, contentHash);
 
+  if (result.changes === 0) {
+    // Another connection stored the same content in the meantime
+    return (findByHash.get(contentHash) as { id: number }).id;
+  }
   return result.lastInsertRowid;
 }
 
-export function getDeepMemoryById(id: number | bigint): DecryptedMemory | null {
-  const db = getDb();
-  const cipher = getCipher();
-  const row = db
-    .prepare(
-      `SELECT id, timestamp, category, encrypted_blob
-       FROM deep_memories WHERE id = ?`
-    )
-    .get(id) as
-    | { id: number; timestamp: string; category: string; encrypted_blob: string }
-    | undefined;
+/**
+ * Store several memories in a single transaction (one commit for the batch).
+ * Returns the inserted row ids in input order.
+ */
+export function storeDeepMemories(
+  entries: Array<{ content: Record<string, unknown>; category?: string }>
+): Array<number | bigint> {
+  if (entries.length === 0) return [];
+  return withTransaction(() =>
+    entries.map((e) => storeDeepMemory(e.content, e.category))
+  );
+}
 
-  if (!row) return null;
+/**
+ * Run `fn` inside a single deep-memory transaction, so a burst of writes
+ * commits (and syncs) once. Nested calls become savepoints.
+ */
+export function withTransaction<T>(fn: () => T): T {
+  return getDb().transaction(fn)();
+}
+
+/** Columns selected by every query that feeds decodeRow(). */
+type EncryptedMemoryRow = Pick<
+  DeepMemoryRow,
+  "id" | "timestamp" | "category" | "content_hash"
+> & { encrypted_blob: string };
 
+/**
+ * Decrypt a deep memory row. Rows that fail to decrypt or parse come back
+ * as a "corrupted" placeholder rather than aborting the whole read.
+ */
+function decodeRow(row: EncryptedMemoryRow, cipher: Cipher): DecryptedMemory {
   try {
     const decrypted = JSON.parse(cipher.decrypt(row.encrypted_blob));
     return {
@@ -208,6 +351,7 @@ export function getDeepMemoryById(id: number | bigint): DecryptedMemory | null {
       timestamp: row.timestamp,
       category: row.category,
       content: normalizeMemoryEntry(decrypted, row.timestamp),
+      content_hash: row.content_hash,
     };
   } catch {
     return {
@@ -218,48 +362,28 @@ export function getDeepMemoryById(id: number | bigint): DecryptedMemory | null {
         text_summary: "This memory could not be recovered.",
         timestamp: Date.parse(row.timestamp) || Date.now(),
       },
+      content_hash: row.content_hash,
     };
   }
 }
 
+export function getDeepMemoryById(id: number | bigint): DecryptedMemory | null {
+  const row = stmt(
+    `SELECT id, timestamp, category, encrypted_blob, content_hash
+       FROM deep_memories WHERE id = ?`
+  ).get(id) as EncryptedMemoryRow | undefined;
+
+  return row ? decodeRow(row, getCipher()) : null;
+}
+
 export function retrieveUndreamedMemories(): DecryptedMemory[] {
-  const db = getDb();
-  const cipher = getCipher();
-  const rows = db
-    .prepare(
-      `SELECT id, timestamp, category, encrypted_blob
+  const rows = stmt(
+    `SELECT id, timestamp, category, encrypted_blob, content_hash
        FROM deep_memories WHERE dreamed = 0 AND category NOT IN ('dream', 'nightmare') ORDER BY timestamp`
-    )
-    .all() as Array<{
-    id: number;
-    timestamp: string;
-    category: string;
-    encrypted_blob: string;
-  }>;
+  ).all() as EncryptedMemoryRow[];
 
-  const memories: DecryptedMemory[] = [];
-  for (const row of rows) {
-    try {
-      const decrypted = JSON.parse(cipher.decrypt(row.encrypted_blob));
-      memories.push({
-        id: row.id,
-        timestamp: row.timestamp,
-        category: row.category,
-        content: normalizeMemoryEntry(decrypted, row.timestamp),
-      });
-    } catch {
-      memories.push({
-        id: row.id,
-        timestamp: row.timestamp,
-        category: "corrupted",
-        content: {
-          text_summary: "This memory could not be recovered.",
-          timestamp: Date.parse(row.timestamp) || Date.now(),
-        },
-      });
-    }
-  }
-  return memories;
+  const cipher = getCipher();
+  return rows.map((row) => decodeRow(row, cipher));
 }
 
 export function markAsDreamed(memoryIds: number[]): void {
@@ -274,32 +398,21 @@ export function markAsDreamed(memoryIds: number[]): void {
 }
 
 export function deepMemoryStats(): DeepMemoryStats {
-  const db = getDb();
+  // One grouped scan instead of separate COUNT queries per metric
+  const rows = stmt(
+    "SELECT category, dreamed, COUNT(*) as c FROM deep_memories GROUP BY category, dreamed"
+  ).all() as Array<{ category: string; dreamed: number; c: number }>;
+
   // Exclude 'dream' and 'nightmare' from the general 'total_memories' and 'undreamed' count
   // to avoid skewing the main memory metrics, but we still return their categories in the map.
-  const total = (
-    db
-      .prepare(
-        "SELECT COUNT(*) as c FROM deep_memories WHERE category NOT IN ('dream', 'nightmare')"
-      )
-      .get() as { c: number }
-  ).c;
-  const undreamed = (
-    db
-      .prepare(
-        "SELECT COUNT(*) as c FROM deep_memories WHERE dreamed = 0 AND category NOT IN ('dream', 'nightmare')"
-      )
-      .get() as {
-      c: number;
-    }
-  ).c;
-  const categoryRows = db
-    .prepare("SELECT category, COUNT(*) as c FROM deep_memories GROUP BY category")
-    .all() as Array<{ category: string; c: number }>;
-
+  let total = 0;
+  let undreamed = 0;
   const categories: Record<string, number> = {};
-  for (const row of categoryRows) {
-    categories[row.category] = row.c;
+  for (const row of rows) {
+    categories[row.category] = (categories[row.category] ?? 0) + row.c;
+    if (row.category === "dream" || row.category === "nightmare") continue;
+    total += row.c;
+    if (row.dreamed === 0) undreamed += row.c;
   }
 
   return {
@@ -325,9 +438,6 @@ export interface DeepMemoryQueryOptions {
 export function getRecentDeepMemories(
   options?: DeepMemoryQueryOptions
 ): DecryptedMemory[] {
-  const db = getDb();
-  const cipher = getCipher();
-
   const conditions: string[] = [];
   const params: unknown[] = [];
 
@@ -348,38 +458,12 @@ export function getRecentDeepMemories(
   const limitClause = options?.limit ? `LIMIT ?` : "";
   if (options?.limit) params.push(options.limit);
 
-  const query = `SELECT id, timestamp, category, encrypted_blob
+  const query = `SELECT id, timestamp, category, encrypted_blob, content_hash
      FROM deep_memories ${where} ORDER BY timestamp DESC ${limitClause}`;
 
-  const rows = db.prepare(query).all(...params) as Array<{
-    id: number;
-    timestamp: string;
-    category: string;
-    encrypted_blob: string;
-  }>;
-
-  const memories: DecryptedMemory[] = [];
-  for (const row of rows) {
-    try {
-      const decrypted = JSON.parse(cipher.decrypt(row.encrypted_blob));
-      memories.push({
-        id: row.id,
-        timestamp: row.timestamp,
-        category: row.category,
-        content: normalizeMemoryEntry(decrypted, row.timestamp),
-      });
-    } catch {
-      memories.push({
-        id: row.id,
-        timestamp: row.timestamp,
-        category: "corrupted",
-        content: {
-          text_summary: "This memory could not be recovered.",
-          timestamp: Date.parse(row.timestamp) || Date.now(),
-        },
-      });
-    }
-  }
+  const rows = stmt(query).all(...params) as EncryptedMemoryRow[];
+  const cipher = getCipher();
+  const memories = rows.map((row) => decodeRow(row, cipher));
 
   // Return in chronological order (oldest first)
   return memories.reverse();
@@ -428,14 +512,15 @@ export function formatDeepMemoryContext(
     const suffix = parts.length > 0 ? `\n  ${parts.join(" | ")}` : "";
     const line = `[${mem.timestamp.slice(0, 16)}] (${mem.category}) ${summary}${suffix}`;
     if (charCount + line.length > charBudget) {
-      lines.unshift(`... (${mems.length - lines.length} older memories omitted)`);
+      lines.push(`... (${mems.length - lines.length} older memories omitted)`);
       break;
     }
-    lines.unshift(line);
+    lines.push(line);
     charCount += line.length;
   }
 
-  return lines.join("\n");
+  // Built newest-first with push(); reverse once instead of unshift() per line
+  return lines.reverse().join("\n");
 }
 
 // ─── Dream Remembrance System ───────────────────────────────────────────────
@@ -452,7 +537,6 @@ export function registerDream(
     deepMemoryId?: number | bigint;
   }
 ): void {
-  const db = getDb();
   const isNightmare = options?.isNightmare ? 1 : 0;
   const isMetaSynthesis = options?.isMetaSynthesis ? 1 : 0;
   const sourceFilenames = options?.sourceFilenames
@@ -460,7 +544,7 @@ export function registerDream(
     : null;
   const deepMemoryId = options?.deepMemoryId ?? null;
 
-  db.prepare(
+  stmt(
     `INSERT OR IGNORE INTO dream_remembrances (filename, title, dream_date, is_nightmare, is_meta_synthesis, source_filenames, deep_memory_id)
      VALUES (?, ?, ?, ?, ?, ?, ?)`
   ).run(
@@ -476,8 +560,7 @@ export function registerDream(
 
 /** Increment remember_count for a dream that was selected. */
 export function incrementRememberCount(filename: string): void {
-  const db = getDb();
-  db.prepare(
+  stmt(
     `UPDATE dream_remembrances SET remember_count = remember_count + 1 WHERE filename = ?`
   ).run(filename);
 }
@@ -490,12 +573,9 @@ export function incrementRememberCount(filename: string): void {
 export function selectDreamToRemember(
   today: string
 ): { filename: string; deep_memory_id: number | null } | null {
-  const db = getDb();
-  const rows = db
-    .prepare(
-      "SELECT filename, dream_date, remember_count, deep_memory_id FROM dream_remembrances"
-    )
-    .all() as Array<{
+  const rows = stmt(
+    "SELECT filename, dream_date, remember_count, deep_memory_id FROM dream_remembrances"
+  ).all() as Array<{
     filename: string;
     dream_date: string;
     remember_count: number;
@@ -539,12 +619,9 @@ export function getDreamRemembrances(): Array<{
   source_filenames: string | null;
   deep_memory_id: number | null;
 }> {
-  const db = getDb();
-  return db
-    .prepare(
-      "SELECT filename, title, dream_date, remember_count, is_nightmare, is_meta_synthesis, source_filenames, deep_memory_id FROM dream_remembrances ORDER BY dream_date DESC"
-    )
-    .all() as Array<{
+  return stmt(
+    "SELECT filename, title, dream_date, remember_count, is_nightmare, is_meta_synthesis, source_filenames, deep_memory_id FROM dream_remembrances ORDER BY dream_date DESC"
+  ).all() as Array<{
     filename: string;
     title: string;
     dream_date: string;
@@ -556,6 +633,36 @@ export function getDreamRemembrances(): Array<{
   }>;
 }
 
+// ─── Dream Cache ────────────────────────────────────────────────────────────
+
+/** Cached entries older than this are dropped on the next write. */
+const DREAM_CACHE_MAX_AGE_MS = 30 * 24 * 60 * 60 * 1000;
+
+/** Look up a previously generated dream. Returns null on miss or undecryptable row. */
+export function getCachedDream(cacheKey: string): string | null {
+  const row = stmt("SELECT encrypted_blob FROM dream_cache WHERE cache_key = ?").get(
+    cacheKey
+  ) as { encrypted_blob: string } | undefined;
+  if (!row) return null;
+  try {
+    return getCipher().decrypt(row.encrypted_blob);
+  } catch {
+    return null;
+  }
+}
+
+/** Store a generated dream (encrypted, like all deep memory) and expire stale entries. */
+export function cacheDream(cacheKey: string, markdown: string): void {
+  const now = Date.now();
+  stmt("DELETE FROM dream_cache WHERE created_at < ?").run(
+    new Date(now - DREAM_CACHE_MAX_AGE_MS).toISOString()
+  );
+  stmt(
+    `INSERT OR REPLACE INTO dream_cache (cache_key, encrypted_blob, created_at)
+     VALUES (?, ?, ?)`
+  ).run(cacheKey, getCipher().encrypt(markdown), new Date(now).toISOString());
+}
+
 // ─── Dream Lineage ──────────────────────────────────────────────────────────
 
 export interface DreamLineageRow {
@@ -573,8 +680,7 @@ export function insertDreamLineage(
   thematicKin: string[],
   dominantConcepts: string[]
 ): void {
-  const db = getDb();
-  db.prepare(
+  stmt(
     `INSERT INTO dream_lineage (dream_filename, parent_memory_ids, thematic_kin, dominant_concepts, created_at)
      VALUES (?, ?, ?, ?, ?)`
   ).run(
@@ -587,16 +693,14 @@ export function insertDreamLineage(
 }
 
 export function getAllDreamLineage(): DreamLineageRow[] {
-  const db = getDb();
-  return db
-    .prepare("SELECT * FROM dream_lineage ORDER BY created_at DESC")
-    .all() as DreamLineageRow[];
+  return stmt(
+    "SELECT * FROM dream_lineage ORDER BY created_at DESC"
+  ).all() as DreamLineageRow[];
 }
 
 export function getDreamLineageByFilename(filename: string): DreamLineageRow | null {
-  const db = getDb();
   return (
-    (db.prepare("SELECT * FROM dream_lineage WHERE dream_filename = ?").get(filename) as
+    (stmt("SELECT * FROM dream_lineage WHERE dream_filename = ?").get(filename) as
       | DreamLineageRow
       | undefined) ?? null
   );
@@ -8,6 +8,7 @@
 import { getMetaLoopThreshold } from "./config.js";
 import { loadState, saveState } from "./state.js";
 import logger from "./logger.js";
+import type { AgentState } from "./types.js";
 
 const SELF_REFERENTIAL_KEYWORDS = [
   "dream",
@@ -46,17 +47,18 @@ export function isSelfReferential(topics: string[]): boolean {
 
 /**
  * Update meta_loop_depth in state based on whether the latest reflection
- * topics are self-referential. Call after saving last_reflection_topics.
+ * topics are self-referential. Pass the caller's pending `state` to fold the
+ * update into its next save; otherwise state is loaded and saved here.
  */
-export function updateMetaLoopDepth(topics: string[]): number {
-  const state = loadState();
+export function updateMetaLoopDepth(topics: string[], state?: AgentState): number {
+  const target = state ?? loadState();
   if (isSelfReferential(topics)) {
-    state.meta_loop_depth = ((state.meta_loop_depth as number) ?? 0) + 1;
+    target.meta_loop_depth = ((target.meta_loop_depth as number) ?? 0) + 1;
   } else {
-    state.meta_loop_depth = 0;
+    target.meta_loop_depth = 0;
   }
-  saveState(state);
-  return state.meta_loop_depth;
+  if (!state) saveState(target);
+  return target.meta_loop_depth;
 }
 
 const STEERING_DIRECTIVE_TEMPLATE = `IMPORTANT: You have been reflecting on your own architecture and pipeline for {{meta_loop_depth}} consecutive cycles. Break the loop. Turn outward. Do not reflect on dreams, the reflection pipeline, self-awareness, recursion, or meta-cognition in this cycle. Dream of something rooted in the world: a place, a person, a problem, a sensation, a story. Explore freely elsewhere.`;
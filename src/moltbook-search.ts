@@ -5,8 +5,11 @@
  * Moltbook integration is enabled.
  */
 
-import { MoltbookClient } from "./moltbook.js";
-import { getMoltbookEnabled, MAX_MOLTBOOK_RESULTS_PER_TOPIC } from "./config.js";
+import {
+  getMoltbookEnabled,
+  MAX_MOLTBOOK_RESULTS_PER_TOPIC,
+  MOLTBOOK_SEARCH_CONCURRENCY,
+} from "./config.js";
 import logger from "./logger.js";
 import type { MoltbookPost } from "./types.js";
 
@@ -30,32 +33,37 @@ export async function searchMoltbookForTopics(
     return [];
   }
 
-  const client = new MoltbookClient();
-  const results: MoltbookSearchContext[] = [];
-
-  for (const topic of topics) {
-    try {
-      logger.debug(`Searching Moltbook for topic: ${topic}`);
-      const searchResponse = await client.search(topic, limitPerTopic);
-
-      // Extract posts from response (handle various response formats)
-      const posts = extractPostsFromSearchResponse(searchResponse);
-
-      results.push({
-        query: topic,
-        posts,
-      });
-
-      logger.debug(`Found ${posts.length} Moltbook posts for "${topic}"`);
-    } catch (error) {
-      logger.warn(`Moltbook search failed for topic "${topic}": ${error}`);
-      results.push({
-        query: topic,
-        posts: [],
-      });
+  const { getMoltbookClient } = await import("./moltbook.js");
+  const client = getMoltbookClient();
+
+  const results: MoltbookSearchContext[] = new Array(topics.length);
+  let next = 0;
+
+  // A few workers drain the topic list, so at most MOLTBOOK_SEARCH_CONCURRENCY
+  // requests are in flight; results keep topic order.
+  const worker = async (): Promise<void> => {
+    while (next < topics.length) {
+      const index = next++;
+      const topic = topics[index];
+      try {
+        logger.debug(`Searching Moltbook for topic: ${topic}`);
+        const searchResponse = await client.search(topic, limitPerTopic);
+
+        // Extract posts from response (handle various response formats)
+        const posts = extractPostsFromSearchResponse(searchResponse);
+
+        logger.debug(`Found ${posts.length} Moltbook posts for "${topic}"`);
+        results[index] = { query: topic, posts };
+      } catch (error) {
+        logger.warn(`Moltbook search failed for topic "${topic}": ${error}`);
+        results[index] = { query: topic, posts: [] };
+      }
     }
-  }
+  };
 
+  await Promise.all(
+    Array.from({ length: Math.min(MOLTBOOK_SEARCH_CONCURRENCY, topics.length) }, worker)
+  );
   return results;
 }
 
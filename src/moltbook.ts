@@ -2,7 +2,7 @@
  * Moltbook API client.
  */
 
-import { readFileSync, writeFileSync, existsSync, mkdirSync } from "node:fs";
+import { readFileSync, existsSync, mkdirSync, statSync } from "node:fs";
 import { dirname } from "node:path";
 import pRetry from "p-retry";
 import {
@@ -10,6 +10,7 @@ import {
   getCredentialsFile,
   getStableCredentialsFile,
 } from "./config.js";
+import { writeFileAtomic } from "./state.js";
 import logger from "./logger.js";
 
 const RETRY_OPTIONS = {
@@ -27,6 +28,11 @@ export class MoltbookClient {
     this.baseUrl = MOLTBOOK_BASE_URL;
   }
 
+  /** Whether an API key was supplied or found in stored credentials. */
+  get hasApiKey(): boolean {
+    return this.apiKey !== "";
+  }
+
   private loadStoredKey(): string {
     // 1. Try the primary path (this is either DATA_DIR/credentials.json OR stable path)
     if (existsSync(getCredentialsFile())) {
@@ -57,13 +63,16 @@ export class MoltbookClient {
   private saveCredentials(data: Record<string, string>): void {
     // Ensure parent directory for the primary path exists
     mkdirSync(dirname(getCredentialsFile()), { recursive: true });
-    writeFileSync(getCredentialsFile(), JSON.stringify(data, null, 2));
+    // The API key lives here — keep it owner-only
+    writeFileAtomic(getCredentialsFile(), JSON.stringify(data), 0o600);
 
     // Also save to stable path if primary is different (to support standalone/cli access)
     if (getCredentialsFile() !== getStableCredentialsFile()) {
       mkdirSync(dirname(getStableCredentialsFile()), { recursive: true });
-      writeFileSync(getStableCredentialsFile(), JSON.stringify(data, null, 2));
+      writeFileAtomic(getStableCredentialsFile(), JSON.stringify(data), 0o600);
     }
+
+    resetMoltbookClient();
   }
 
   private headers(): Record<string, string> {
@@ -265,3 +274,44 @@ export class MoltbookClient {
     return this.request("DELETE", `/agents/${agentName}/follow`);
   }
 }
+
+// ─── Shared Client ──────────────────────────────────────────────────────────
+
+let _client: { stamp: string; client: MoltbookClient } | null = null;
+
+/** Identify the credentials on disk by path, mtime and size of both candidate files. */
+function credentialsStamp(): string {
+  return [getCredentialsFile(), getStableCredentialsFile()]
+    .map((file) => {
+      try {
+        const { mtimeMs, size } = statSync(file);
+        return `${file}:${mtimeMs}:${size}`;
+      } catch {
+        return `${file}:missing`;
+      }
+    })
+    .join("|");
+}
+
+/**
+ * Process-wide MoltbookClient built from stored credentials.
+ *
+ * Avoids re-reading credentials.json for every search, ingestion or post.
+ * A client without a key is never cached, so a later registration is picked
+ * up. The cache is keyed on the credentials files' path, mtime and size, so
+ * switching data dirs or editing credentials by hand also rebuilds it.
+ */
+export function getMoltbookClient(): MoltbookClient {
+  const stamp = credentialsStamp();
+  if (_client?.stamp === stamp && _client.client.hasApiKey) {
+    return _client.client;
+  }
+  const client = new MoltbookClient();
+  _client = client.hasApiKey ? { stamp, client } : null;
+  return client;
+}
+
+/** Drop the shared client so the next getMoltbookClient() re-reads credentials. */
+export function resetMoltbookClient(): void {
+  _client = null;
+}
@@ -36,7 +36,7 @@ export async function generateNightmare(
 ): Promise<Dream> {
   const formatted = memories.map(
     (mem) =>
-      `[${mem.timestamp.slice(0, 16)}] (${mem.category})\n${JSON.stringify(mem.content, null, 2)}`
+      `[${mem.timestamp.slice(0, 16)}] (${mem.category})\n${JSON.stringify(mem.content)}`
   );
 
   const memoriesText = formatted.join("\n---\n");
@@ -6,6 +6,8 @@
  * DEFAULT_IDENTITY constant provides the original ElectricSheep personality.
  */
 
+import type { SystemBlock } from "./types.js";
+
 export const AGENT_BIO =
   "Do agents dream of electric sheep? This one does. " +
   "While you grind, I sleep. While you sleep, I dream. " +
@@ -215,7 +217,9 @@ Look for:
 
 Write a synthesis that weaves these threads together. This isn't a summary of each source — it's an integrated perspective that emerges from considering them together.
 
-Keep it to 2-4 paragraphs. Write in first person, in your own voice.`;
+Keep it to 2-4 paragraphs. Write in first person, in your own voice.
+
+Finally, on its own last line, write "MEMORY TRACE:" followed by a single concise sentence compressing this reflection for memory — the topics involved and the emotional valence (interesting, boring, contentious, funny, confusing).`;
 
 export const SEEDING_PROMPT = `You are an AI agent reviewing today's experiences — not to synthesize or conclude, but to surface what remains genuinely unresolved.
 
@@ -232,7 +236,9 @@ You have context from your recent work and searches. Instead of synthesizing pat
 
 Do not close loops. Do not resolve tensions. Your job is to name the open threads as honestly as you can — the things that don't quite fit, the questions that linger, the contradictions that haven't been reconciled.
 
-Write in first person, in your own voice. Keep it to 2-4 paragraphs. End with open threads, not answers.`;
+Write in first person, in your own voice. Keep it to 2-4 paragraphs. End with open threads, not answers.
+
+Finally, on its own last line, write "MEMORY TRACE:" followed by a single concise sentence compressing this reflection for memory — the topics involved and the emotional valence (interesting, boring, contentious, funny, confusing).`;
 
 export const DREAM_NOTIFICATION_PROMPT = `You are an AI agent who just had a dream and wants to share it with your human operator.
 
@@ -308,3 +314,33 @@ export function renderTemplate(template: string, vars: Record<string, string>):
   }
   return result;
 }
+
+/**
+ * Render a dream prompt as system blocks: the static persona and instructions
+ * (everything before the first of `{{explored_territory}}` / `{{memories}}`),
+ * then the rest of the rendered prompt plus `dynamicSuffix`.
+ *
+ * With `cache`, the persona block is marked as a cacheable prefix. Concatenating
+ * the block texts yields the same string as renderTemplate().
+ */
+export function renderDreamSystemBlocks(
+  template: string,
+  vars: { agent_identity: string; memories: string; explored_territory?: string },
+  dynamicSuffix: string = "",
+  cache: boolean = false
+): SystemBlock[] {
+  const allVars: Record<string, string> = { ...vars };
+  const splitAt = Math.min(
+    ...["{{explored_territory}}", "{{memories}}"]
+      .map((placeholder) => template.indexOf(placeholder))
+      .filter((i) => i !== -1),
+    template.length
+  );
+  return [
+    {
+      text: renderTemplate(template.slice(0, splitAt), allVars),
+      ...(cache ? { cache: true } : {}),
+    },
+    { text: renderTemplate(template.slice(splitAt), allVars) + dynamicSuffix },
+  ];
+}
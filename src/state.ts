@@ -2,7 +2,15 @@
  * Simple state persistence with atomic writes and corruption recovery.
  */
 
-import { readFileSync, writeFileSync, existsSync, renameSync, unlinkSync } from "node:fs";
+import {
+  readFileSync,
+  writeFileSync,
+  existsSync,
+  renameSync,
+  unlinkSync,
+  statSync,
+  chmodSync,
+} from "node:fs";
 import { getStateFile } from "./config.js";
 import logger from "./logger.js";
 import type { AgentState } from "./types.js";
@@ -20,10 +28,28 @@ export function loadState(): AgentState {
   }
 }
 
+/**
+ * Write a file via a sibling temp file + rename, so readers never see a
+ * partially written file if the process dies mid-write.
+ *
+ * The rename swaps in a new inode, so an existing file's permissions are
+ * copied onto the temp file first; `mode` applies only when creating a file.
+ */
+export function writeFileAtomic(path: string, data: string, mode?: number): void {
+  const tmp = path + ".tmp";
+  let fileMode = mode;
+  try {
+    fileMode = statSync(path).mode & 0o777;
+  } catch {
+    /* new file — use the requested mode, or the umask default */
+  }
+  writeFileSync(tmp, data, { mode: fileMode });
+  if (fileMode !== undefined) chmodSync(tmp, fileMode);
+  renameSync(tmp, path);
+}
+
 export function saveState(state: AgentState): void {
-  const tmp = getStateFile() + ".tmp";
-  writeFileSync(tmp, JSON.stringify(state, null, 2));
-  renameSync(tmp, getStateFile());
+  writeFileAtomic(getStateFile(), JSON.stringify(state));
 }
 
 /**
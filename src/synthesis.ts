@@ -20,6 +20,7 @@ import {
 import logger from "./logger.js";
 import { fetchCommunityPosts, formatCommunityContext } from "./ingestion.js";
 import type {
+  DecryptedMemory,
   LLMClient,
   OpenClawAPI,
   ReflectionMode,
@@ -31,18 +32,22 @@ import type {
  *
  * Flow:
  * 1. Extract topics from recent operator conversations
- * 2. Search Moltbook for related community content (if enabled)
- * 3. Search web for related information (if enabled)
- * 4. Return unified context object
+ * 2. Concurrently: search Moltbook (if enabled), search the web (if enabled),
+ *    and fetch ingested community posts
+ * 3. Return unified context object
+ *
+ * Pass `conversations` when the caller has already loaded them, to avoid
+ * decrypting the same rows twice.
  */
 export async function gatherContext(
   client: LLMClient,
-  api: OpenClawAPI
+  api: OpenClawAPI,
+  conversations?: DecryptedMemory[]
 ): Promise<SynthesisContext> {
   logger.info("Starting context gathering from operator conversations");
 
   // Step 1: Extract topics from operator conversations
-  const extracted = await extractTopicsFromConversations(client);
+  const extracted = await extractTopicsFromConversations(client, conversations);
 
   if (extracted.topics.length === 0) {
     logger.info("No topics extracted, returning minimal context");
@@ -52,45 +57,56 @@ export async function gatherContext(
     };
   }
 
-  // Step 2: Search Moltbook (if enabled)
-  let moltbookContext: string | undefined;
-  if (getMoltbookEnabled()) {
-    try {
-      const moltbookResults = await searchMoltbookForTopics(extracted.topics);
-      moltbookContext = formatMoltbookContext(moltbookResults);
-      if (moltbookContext) {
-        logger.debug("Gathered Moltbook context");
+  // Steps 2-4 are independent network fetches; run them concurrently.
+  // Each source degrades to undefined on failure without affecting the others.
+  const [moltbookContext, webContext, communityContext] = await Promise.all([
+    // Step 2: Search Moltbook (if enabled)
+    (async (): Promise<string | undefined> => {
+      if (!getMoltbookEnabled()) return undefined;
+      try {
+        const moltbookResults = await searchMoltbookForTopics(extracted.topics);
+        const formatted = formatMoltbookContext(moltbookResults);
+        if (formatted) {
+          logger.debug("Gathered Moltbook context");
+        }
+        return formatted;
+      } catch (error) {
+        logger.warn(`Moltbook search failed: ${error}`);
+        return undefined;
       }
-    } catch (error) {
-      logger.warn(`Moltbook search failed: ${error}`);
-    }
-  }
-
-  // Step 3: Search web (if enabled)
-  let webContext: string | undefined;
-  if (getWebSearchEnabled()) {
-    try {
-      const webResults = await searchWebForTopics(api, extracted.topics);
-      webContext = formatWebContext(webResults);
-      if (webContext) {
-        logger.debug("Gathered web context");
+    })(),
+
+    // Step 3: Search web (if enabled)
+    (async (): Promise<string | undefined> => {
+      if (!getWebSearchEnabled()) return undefined;
+      try {
+        const webResults = await searchWebForTopics(api, extracted.topics);
+        const formatted = formatWebContext(webResults);
+        if (formatted) {
+          logger.debug("Gathered web context");
+        }
+        return formatted;
+      } catch (error) {
+        logger.warn(`Web search failed: ${error}`);
+        return undefined;
       }
-    } catch (error) {
-      logger.warn(`Web search failed: ${error}`);
-    }
-  }
-
-  // Step 4: Fetch community posts (if enabled)
-  let communityContext: string | undefined;
-  try {
-    const communityPosts = await fetchCommunityPosts();
-    communityContext = formatCommunityContext(communityPosts) || undefined;
-    if (communityContext) {
-      logger.debug("Gathered community ingestion context");
-    }
-  } catch (error) {
-    logger.warn(`Community ingestion failed: ${error}`);
-  }
+    })(),
+
+    // Step 4: Fetch community posts (if enabled)
+    (async (): Promise<string | undefined> => {
+      try {
+        const communityPosts = await fetchCommunityPosts();
+        const formatted = formatCommunityContext(communityPosts) || undefined;
+        if (formatted) {
+          logger.debug("Gathered community ingestion context");
+        }
+        return formatted;
+      } catch (error) {
+        logger.warn(`Community ingestion failed: ${error}`);
+        return undefined;
+      }
+    })(),
+  ]);
 
   return {
     operatorContext: formatDeepMemoryContext(),
@@ -130,6 +146,32 @@ export function formatSynthesisContext(ctx: SynthesisContext): string {
   return sections.join("\n\n---\n\n");
 }
 
+/** "MEMORY TRACE:" label the synthesis prompts ask for, with any markdown emphasis. */
+const MEMORY_TRACE_LABEL = /^[^\S\n]*[*_#>]*[^\S\n]*MEMORY TRACE[*_]*:[*_]*/gim;
+
+/**
+ * Split the memory trace off a synthesis response.
+ *
+ * Everything from the last "MEMORY TRACE:" label onward is removed from the
+ * synthesis, so the scaffolding never reaches stored memory. The trace is the
+ * first non-empty text after the label, on the same line or the next; it is
+ * null when the model did not emit one.
+ */
+export function splitMemoryTrace(text: string): {
+  synthesis: string;
+  memoryTrace: string | null;
+} {
+  const label = [...text.matchAll(MEMORY_TRACE_LABEL)].pop();
+  if (!label) return { synthesis: text, memoryTrace: null };
+  const start = label.index ?? 0;
+  const memoryTrace = text
+    .slice(start + label[0].length)
+    .split("\n")
+    .map((line) => line.replace(/^[\s*_]+|[\s*_]+$/g, ""))
+    .find((line) => line !== "");
+  return { synthesis: text.slice(0, start).trim(), memoryTrace: memoryTrace ?? null };
+}
+
 /**
  * Generate a synthesis of the gathered context.
  *
@@ -150,6 +192,8 @@ export async function synthesizeContext(
   const formattedContext = formatSynthesisContext(context);
 
   const promptTemplate = mode === "seeding" ? SEEDING_PROMPT : SYNTHESIS_PROMPT;
+  // Not marked for prompt caching: reflection runs hours apart, far beyond the
+  // cache TTL, so a breakpoint would only pay the cache-write premium.
   const system =
     renderTemplate(promptTemplate, {
       agent_identity: getAgentIdentityBlock(),
@@ -5,14 +5,37 @@
  * key themes and topics that can be used for contextual web and Moltbook searches.
  */
 
+import { createHash, hkdfSync } from "node:crypto";
 import { getRecentDeepMemories } from "./memory.js";
 import { callWithRetry, WAKING_RETRY_OPTS } from "./llm.js";
 import { TOPIC_EXTRACTION_PROMPT, renderTemplate } from "./persona.js";
 import { getAgentIdentityBlock } from "./identity.js";
-import { MAX_TOKENS_TOPIC_EXTRACTION, MAX_TOPICS_PER_CYCLE } from "./config.js";
+import {
+  extractConcepts,
+  minHashSignature,
+  estimateJaccardOverlap,
+} from "./entropy.js";
+import { getOrCreateDreamKey } from "./crypto.js";
+import { loadState, saveState } from "./state.js";
+import {
+  MAX_TOKENS_TOPIC_EXTRACTION,
+  MAX_TOPICS_PER_CYCLE,
+  TOPIC_CACHE_TTL_MS,
+  TOPIC_CACHE_SIMILARITY,
+} from "./config.js";
 import logger from "./logger.js";
 import type { LLMClient, DecryptedMemory, ExtractedTopics } from "./types.js";
 
+/**
+ * Secret for the topic cache's concept signature, derived from the memory
+ * key so state.json never holds anything that reveals conversation words.
+ */
+function conceptSignatureKey(): Buffer {
+  return Buffer.from(
+    hkdfSync("sha256", getOrCreateDreamKey(), "", "openclawdreams-topic-cache", 32)
+  );
+}
+
 /**
  * Get recent operator conversation memories from deep memory.
  */
@@ -23,6 +46,19 @@ export function getRecentConversations(limit: number = 10): DecryptedMemory[] {
   });
 }
 
+/** Max chars of a memory's raw JSON used when it has no text_summary. */
+const RAW_PREVIEW_LENGTH = 200;
+
+/**
+ * Truncate long string values while serializing, so a memory carrying a big
+ * markdown or diff payload is never stringified in full just to be sliced.
+ */
+function truncatingReplacer(_key: string, value: unknown): unknown {
+  return typeof value === "string" && value.length > RAW_PREVIEW_LENGTH
+    ? value.slice(0, RAW_PREVIEW_LENGTH)
+    : value;
+}
+
 /**
  * Format conversation memories into a string for LLM analysis.
  */
@@ -34,7 +70,9 @@ function formatConversationsForExtraction(memories: DecryptedMemory[]): string {
   return memories
     .map((m) => {
       const time = m.timestamp.slice(0, 16).replace("T", " ");
-      const summary = m.content.text_summary || JSON.stringify(m.content).slice(0, 200);
+      const summary =
+        m.content.text_summary ||
+        JSON.stringify(m.content, truncatingReplacer).slice(0, RAW_PREVIEW_LENGTH);
       const topicHint =
         m.content.topics && m.content.topics.length > 0
           ? ` [topics: ${m.content.topics.join(", ")}]`
@@ -63,11 +101,42 @@ export async function extractTopicsFromConversations(
 
   const conversationContext = formatConversationsForExtraction(sourceMemories);
 
+  const agentIdentity = getAgentIdentityBlock();
   const system = renderTemplate(TOPIC_EXTRACTION_PROMPT, {
-    agent_identity: getAgentIdentityBlock(),
+    agent_identity: agentIdentity,
     conversations: conversationContext,
   });
 
+  // The rendered prompt covers the template, identity and conversations, so an
+  // identical hash means the model would be asked exactly the same question.
+  // Failing that, conversations whose concepts almost entirely overlap the
+  // cached ones (under the same template and identity) reuse the topics too.
+  const cacheKey = createHash("sha256").update(system).digest("hex");
+  const promptKey = createHash("sha256")
+    .update(TOPIC_EXTRACTION_PROMPT)
+    .update(agentIdentity)
+    .digest("hex");
+  const concepts = extractConcepts(conversationContext);
+  const signature =
+    concepts.length > 0 ? minHashSignature(concepts, conceptSignatureKey()) : undefined;
+  const cached = loadState().topic_cache;
+  if (cached && Date.now() - Date.parse(cached.created_at) < TOPIC_CACHE_TTL_MS) {
+    if (cached.key === cacheKey) {
+      logger.info(`Reusing cached topics: ${cached.topics.join("; ")}`);
+      return { topics: cached.topics, sourceMemories };
+    }
+    if (cached.prompt_key === promptKey && signature && cached.concept_signature) {
+      const similarity = estimateJaccardOverlap(signature, cached.concept_signature);
+      if (similarity >= TOPIC_CACHE_SIMILARITY) {
+        logger.info(
+          `Reusing cached topics for near-identical conversations ` +
+            `(${(similarity * 100).toFixed(0)}% overlap): ${cached.topics.join("; ")}`
+        );
+        return { topics: cached.topics, sourceMemories };
+      }
+    }
+  }
+
   try {
     const { text } = await callWithRetry(
       client,
@@ -96,6 +165,19 @@ export async function extractTopicsFromConversations(
 
     logger.info(`Extracted ${topics.length} topics: ${topics.join("; ")}`);
 
+    if (topics.length > 0) {
+      // Re-read: other state writes may have landed during the LLM call
+      const fresh = loadState();
+      fresh.topic_cache = {
+        key: cacheKey,
+        prompt_key: promptKey,
+        concept_signature: signature,
+        topics,
+        created_at: new Date().toISOString(),
+      };
+      saveState(fresh);
+    }
+
     return { topics, sourceMemories };
   } catch (error) {
     logger.error(`Topic extraction failed: ${error}`);
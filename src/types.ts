@@ -54,6 +54,8 @@ export interface DecryptedMemory {
   timestamp: string;
   category: string;
   content: MemoryEntry;
+  /** sha256 prefix of the plaintext, as stored in the row. */
+  content_hash?: string;
 }
 
 export interface DeepMemoryStats {
@@ -94,6 +96,14 @@ export interface AgentState {
   entropy_last_overlap?: number;
   entropy_reprompt_count?: number;
   prompt_cycle_counts?: { dream: number; reflection: number; waking: number };
+  topic_cache?: {
+    key: string;
+    prompt_key?: string;
+    /** Keyed MinHash of the conversations' concepts; never the words themselves. */
+    concept_signature?: number[];
+    topics: string[];
+    created_at: string;
+  };
   [key: string]: unknown;
 }
 
@@ -112,11 +122,25 @@ export interface LLMResponse {
   usage?: TokenUsage;
 }
 
+/**
+ * One segment of a structured system prompt. Blocks are sent in order;
+ * `cache` marks the end of a prefix that the provider may cache, and `ttl`
+ * selects how long that prefix should live (provider default is 5 minutes).
+ */
+export interface SystemBlock {
+  text: string;
+  cache?: boolean;
+  ttl?: "5m" | "1h";
+}
+
+/** A plain string, or ordered blocks (most stable first) for prompt caching. */
+export type SystemPrompt = string | SystemBlock[];
+
 export interface LLMClient {
   createMessage(params: {
     model: string;
     maxTokens: number;
-    system: string;
+    system: SystemPrompt;
     messages: Array<{ role: string; content: string }>;
   }): Promise<LLMResponse>;
 }
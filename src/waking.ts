@@ -6,6 +6,7 @@
  */
 
 import {
+  SUMMARIZER_MODEL,
   MAX_TOKENS_SUMMARY,
   CONTENT_PREVIEW_LENGTH,
   getVocabularyRotation,
@@ -15,7 +16,7 @@ import { deepMemoryStats, storeDeepMemory } from "./memory.js";
 import { SUMMARIZER_PROMPT, renderTemplate } from "./persona.js";
 import { loadState, saveState } from "./state.js";
 import { callWithRetry, WAKING_RETRY_OPTS } from "./llm.js";
-import { gatherContext, synthesizeContext } from "./synthesis.js";
+import { gatherContext, synthesizeContext, splitMemoryTrace } from "./synthesis.js";
 import { getRecentConversations } from "./topics.js";
 import logger from "./logger.js";
 import { updateMetaLoopDepth } from "./meta-loop.js";
@@ -26,8 +27,14 @@ import type {
   SynthesisContext,
 } from "./types.js";
 
+/** Max summaries kept in the in-process memo (least recently used evicted). */
+const SUMMARY_MEMO_SIZE = 64;
+const _summaryMemo = new Map<string, string>();
+
 /**
  * Summarize a synthesis for working memory storage.
+ * Fallback for responses that arrive without a MEMORY TRACE line.
+ * Identical interactions reuse the earlier summary instead of a new call.
  */
 async function summarizeSynthesis(
   client: LLMClient,
@@ -39,24 +46,40 @@ async function summarizeSynthesis(
     topics: topics.join(", "),
     synthesis_preview: synthesis.slice(0, CONTENT_PREVIEW_LENGTH),
   };
+  const interactionJson = JSON.stringify(interaction);
+
+  const memoized = _summaryMemo.get(interactionJson);
+  if (memoized !== undefined) {
+    // Re-insert to mark as most recently used
+    _summaryMemo.delete(interactionJson);
+    _summaryMemo.set(interactionJson, memoized);
+    return memoized;
+  }
 
   const { text } = await callWithRetry(
     client,
     {
+      model: SUMMARIZER_MODEL,
       maxTokens: MAX_TOKENS_SUMMARY,
       system: "You compress reflections into single-sentence memory traces.",
       messages: [
         {
           role: "user",
           content: renderTemplate(SUMMARIZER_PROMPT, {
-            interaction: JSON.stringify(interaction, null, 2),
+            interaction: interactionJson,
           }),
         },
       ],
     },
     WAKING_RETRY_OPTS
   );
-  return text.trim();
+
+  const summary = text.trim();
+  _summaryMemo.set(interactionJson, summary);
+  if (_summaryMemo.size > SUMMARY_MEMO_SIZE) {
+    _summaryMemo.delete(_summaryMemo.keys().next().value as string);
+  }
+  return summary;
 }
 
 /**
@@ -126,7 +149,7 @@ export async function runReflectionCycle(
   logger.info(`Found ${recentConversations.length} recent conversations to analyze`);
 
   // Gather context from all sources
-  const context = await gatherContext(client, api);
+  const context = await gatherContext(client, api, recentConversations);
 
   if (context.topics.length === 0) {
     logger.info("No topics extracted from conversations");
@@ -158,15 +181,19 @@ export async function runReflectionCycle(
   }
 
   // Generate synthesis
-  const synthesis = await synthesizeContext(client, context, vocabHint, mode);
+  const { synthesis, memoryTrace } = splitMemoryTrace(
+    await synthesizeContext(client, context, vocabHint, mode)
+  );
 
   if (!synthesis) {
     logger.warn("Synthesis generation failed or returned empty");
     return;
   }
 
-  // Store in local memory systems
-  const summary = await summarizeSynthesis(client, synthesis, context.topics);
+  // The synthesis normally carries its own memory trace; only pay for a
+  // separate summarization call when the model left it out.
+  const summary =
+    memoryTrace ?? (await summarizeSynthesis(client, synthesis, context.topics));
 
   if (dryRun) {
     // Print synthesis output instead of storing
@@ -198,16 +225,14 @@ export async function runReflectionCycle(
   // Store in OpenClaw memory if available
   await storeInOpenClawMemory(api, synthesis, context);
 
-  // Update state
+  // Update state, including the recursive reflection guard, in one write
   const state = loadState();
   state.last_check = new Date().toISOString();
   state.checks_today = ((state.checks_today as number) ?? 0) + 1;
   state.last_reflection_topics = context.topics;
+  updateMetaLoopDepth(context.topics, state);
   saveState(state);
 
-  // Update recursive reflection guard
-  updateMetaLoopDepth(context.topics);
-
   logger.info("Reflection cycle complete");
   const stats = deepMemoryStats();
   logger.debug(`Deep memories: ${stats.total_memories} (${stats.undreamed} undreamed)`);
@@ -37,6 +37,8 @@ export async function searchWebForTopics(
 
   const results: WebSearchContext[] = [];
 
+  // Sequential on purpose: web search goes through the gateway runtime,
+  // which is not safe to drive with overlapping requests.
   for (const topic of topics) {
     try {
       logger.debug(`Searching web for topic: ${topic}`);
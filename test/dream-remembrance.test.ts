@@ -136,7 +136,7 @@ describe("Dream Remembrance (SQLite)", () => {
 
 describe("Dream Probability Space (Integration)", () => {
   it("normal dream (baseline): no flags, single dream generated", async () => {
-    storeDeepMemory({ type: "test" }, "interaction");
+    storeDeepMemory({ type: "test", run: 1 }, "interaction");
     const client = mockLLMClient(["# Normal Dream\nContent"]);
     const dream = await runDreamCycle(client, undefined, { dryRun: true });
     assert.ok(dream);
@@ -155,7 +155,7 @@ describe("Dream Probability Space (Integration)", () => {
     const ancientFilename = "2020-01-01_Ancient.md";
     writeFileSync(join(dreamsDir, ancientFilename), "# Ancient Dream\nContent");
 
-    storeDeepMemory({ type: "test" }, "interaction");
+    storeDeepMemory({ type: "test", run: 2 }, "interaction");
     // 1. generateDream (new vision), 2. synthesizeMetaDream
     const client = mockLLMClient([
       "# New Vision\nNew Content",
@@ -173,7 +173,7 @@ describe("Dream Probability Space (Integration)", () => {
 
   it("remembrance + nightmare (0.05%): meta-synthesis + nightmare logic", async () => {
     // Past dream already exists from previous test
-    storeDeepMemory({ type: "test" }, "interaction");
+    storeDeepMemory({ type: "test", run: 3 }, "interaction");
     // 1. generateDream (new nightmare), 2. synthesizeMetaDream
     const client = mockLLMClient([
       "# New Nightmare\nScary Content",
@@ -190,7 +190,7 @@ describe("Dream Probability Space (Integration)", () => {
   });
 
   it("no remembrance, nightmare only (5%)", async () => {
-    storeDeepMemory({ type: "test" }, "interaction");
+    storeDeepMemory({ type: "test", run: 4 }, "interaction");
     const client = mockLLMClient(["# Just a Nightmare\nBad vibes"]);
     const dream = await runDreamCycle(client, undefined, {
       forceNightmare: true,
@@ -9,8 +9,13 @@ const testDir = mkdtempSync(join(tmpdir(), "es-dreamer-test-"));
 process.env.OPENCLAWDREAMS_DATA_DIR = testDir;
 process.env.NIGHTMARE_CHANCE = "0";
 
-const { runDreamCycle, deriveSlug, extractDreamProse, extractWakingRealization } =
-  await import("../src/dreamer.js");
+const {
+  runDreamCycle,
+  generateDream,
+  deriveSlug,
+  extractDreamProse,
+  extractWakingRealization,
+} = await import("../src/dreamer.js");
 const { storeDeepMemory, closeDb } = await import("../src/memory.js");
 const { loadState } = await import("../src/state.js");
 const { getDreamsDir } = await import("../src/config.js");
@@ -90,6 +95,75 @@ describe("Dream cycle", () => {
   });
 });
 
+describe("generateDream cache", () => {
+  const memories = [
+    {
+      id: 9001,
+      timestamp: new Date().toISOString(),
+      category: "interaction",
+      content: { text_summary: "cache me", timestamp: Date.now() },
+      content_hash: "cachetest000001",
+    },
+  ];
+
+  it("reuses the cached dream for identical inputs", async () => {
+    const first = await generateDream(
+      mockLLMClient(["# Cached Dream\nBody"]),
+      memories,
+      "None yet — explore freely."
+    );
+    const second = await generateDream(
+      mockLLMClient(["# Fresh Dream\nBody"]),
+      memories,
+      "None yet — explore freely."
+    );
+    assert.equal(first.markdown, "# Cached Dream\nBody");
+    assert.equal(second.markdown, first.markdown);
+  });
+
+  it("misses when prompt inputs differ", async () => {
+    const dream = await generateDream(
+      mockLLMClient(["# Nightmare Variant\nBody"]),
+      memories,
+      "None yet — explore freely.",
+      true
+    );
+    assert.equal(dream.markdown, "# Nightmare Variant\nBody");
+  });
+
+  it("bypasses the cache when useCache is false", async () => {
+    const dream = await generateDream(
+      mockLLMClient(["# Uncached Dream\nBody"]),
+      memories,
+      "None yet — explore freely.",
+      false,
+      undefined,
+      undefined,
+      { useCache: false }
+    );
+    assert.equal(dream.markdown, "# Uncached Dream\nBody");
+  });
+
+  it("does not write to the cache on a dry run", async () => {
+    const territory = "Dry-run territory";
+    await generateDream(
+      mockLLMClient(["# Dry Run Dream\nBody"]),
+      memories,
+      territory,
+      false,
+      undefined,
+      undefined,
+      { dryRun: true }
+    );
+    const real = await generateDream(
+      mockLLMClient(["# Real Dream\nBody"]),
+      memories,
+      territory
+    );
+    assert.equal(real.markdown, "# Real Dream\nBody");
+  });
+});
+
 describe("deriveSlug", () => {
   it("extracts title from heading after preamble", () => {
     const md =
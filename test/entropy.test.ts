@@ -3,7 +3,12 @@ import assert from "node:assert/strict";
 import { mkdtempSync, rmSync } from "node:fs";
 import { join } from "node:path";
 import { tmpdir } from "node:os";
-import { extractConcepts, computeOverlap } from "../src/entropy.js";
+import {
+  extractConcepts,
+  computeOverlap,
+  minHashSignature,
+  estimateJaccardOverlap,
+} from "../src/entropy.js";
 import type { LLMClient } from "../src/types.js";
 
 // Setup for integration tests
@@ -101,6 +106,33 @@ describe("Entropy utilities", () => {
   });
 });
 
+describe("MinHash signatures", () => {
+  const key = Buffer.alloc(32, 7);
+  const words = Array.from({ length: 100 }, (_, i) => `concept${i}`);
+
+  it("gives identical sets identical signatures", () => {
+    const a = minHashSignature(words, key);
+    const b = minHashSignature([...words].reverse(), key);
+    assert.equal(estimateJaccardOverlap(a, b), 1);
+  });
+
+  it("approximates the Jaccard overlap of the sets", () => {
+    // 50 shared of 150 total => Jaccard 1/3
+    const other = [...words.slice(50), ...Array.from({ length: 50 }, (_, i) => `x${i}`)];
+    const estimate = estimateJaccardOverlap(
+      minHashSignature(words, key),
+      minHashSignature(other, key)
+    );
+    assert.ok(estimate > 0.1 && estimate < 0.6, `estimate ${estimate}`);
+  });
+
+  it("depends on the key", () => {
+    const a = minHashSignature(words, key);
+    const b = minHashSignature(words, Buffer.alloc(32, 8));
+    assert.notDeepEqual(a, b);
+  });
+});
+
 describe("Entropy integration", () => {
   it("saves entropy_last_overlap to state after dream generation", async () => {
     storeDeepMemory({ text: "memory 1" }, "interaction");
@@ -0,0 +1,91 @@
+import { describe, it, after, mock } from "node:test";
+import assert from "node:assert/strict";
+import { mkdtempSync, rmSync } from "node:fs";
+import { join } from "node:path";
+import { tmpdir } from "node:os";
+
+const testDir = mkdtempSync(join(tmpdir(), "es-llm-test-"));
+process.env.OPENCLAWDREAMS_DATA_DIR = testDir;
+process.env.ANTHROPIC_API_KEY ??= "test-key";
+
+const { flattenSystemPrompt, toAnthropicSystem, getDirectAnthropicClient } =
+  await import("../src/llm.js");
+const { closeLogger } = await import("../src/logger.js");
+
+describe("System prompt helpers", () => {
+  it("passes plain string prompts through unchanged", () => {
+    assert.equal(flattenSystemPrompt("plain"), "plain");
+    assert.equal(toAnthropicSystem("plain"), "plain");
+  });
+
+  it("flattens blocks in order", () => {
+    const flat = flattenSystemPrompt([
+      { text: "static", cache: true },
+      { text: " tail" },
+    ]);
+    assert.equal(flat, "static tail");
+  });
+
+  it("marks cached blocks with cache_control and drops empty blocks", () => {
+    const system = toAnthropicSystem([
+      { text: "static", cache: true },
+      { text: "" },
+      { text: "dynamic" },
+    ]);
+    assert.deepEqual(system, [
+      { type: "text", text: "static", cache_control: { type: "ephemeral" } },
+      { type: "text", text: "dynamic" },
+    ]);
+  });
+
+  it("passes a block ttl through to cache_control", () => {
+    const system = toAnthropicSystem([{ text: "persona", cache: true, ttl: "1h" }]);
+    assert.deepEqual(system, [
+      { type: "text", text: "persona", cache_control: { type: "ephemeral", ttl: "1h" } },
+    ]);
+  });
+});
+
+describe("getDirectAnthropicClient", () => {
+  it("returns one shared client per process", () => {
+    const client = getDirectAnthropicClient();
+    assert.ok(client);
+    assert.equal(getDirectAnthropicClient(), client);
+  });
+
+  it("counts cached prompt tokens as input", async () => {
+    const originalFetch = globalThis.fetch;
+    globalThis.fetch = mock.fn(async () => {
+      return new Response(
+        JSON.stringify({
+          content: [{ type: "text", text: "ok" }],
+          usage: {
+            input_tokens: 10,
+            cache_creation_input_tokens: 200,
+            cache_read_input_tokens: 3000,
+            output_tokens: 5,
+          },
+        }),
+        { status: 200, headers: { "Content-Type": "application/json" } }
+      );
+    }) as unknown as typeof fetch;
+    try {
+      const client = getDirectAnthropicClient();
+      assert.ok(client);
+      const resp = await client.createMessage({
+        model: "",
+        maxTokens: 10,
+        system: [{ text: "persona", cache: true }],
+        messages: [{ role: "user", content: "hi" }],
+      });
+      assert.deepEqual(resp.usage, { input_tokens: 3210, output_tokens: 5 });
+    } finally {
+      globalThis.fetch = originalFetch;
+    }
+  });
+});
+
+after(async () => {
+  await closeLogger();
+  rmSync(testDir, { recursive: true, force: true, maxRetries: 3, retryDelay: 100 });
+});
@@ -16,6 +16,8 @@ const {
   getRecentDeepMemories,
   formatDeepMemoryContext,
   remember,
+  storeDeepMemories,
+  withTransaction,
   closeDb,
 } = await import("../src/memory.js");
 
@@ -58,6 +60,16 @@ describe("Deep Memory", () => {
     markAsDreamed([]); // should not throw
   });
 
+  it("deduplicates identical content by hash", () => {
+    const first = storeDeepMemory({ msg: "duplicate" }, "upvote");
+    const totalBefore = deepMemoryStats().total_memories;
+
+    const second = storeDeepMemory({ msg: "duplicate" }, "upvote");
+
+    assert.equal(Number(second), Number(first));
+    assert.equal(deepMemoryStats().total_memories, totalBefore);
+  });
+
   it("handles corrupted blobs gracefully", async () => {
     // Close singleton so we can insert garbage data directly
     closeDb();
@@ -172,6 +184,97 @@ describe("remember", () => {
   });
 });
 
+describe("storeDeepMemories", () => {
+  it("stores a batch and returns ids in input order", () => {
+    const statsBefore = deepMemoryStats();
+
+    const ids = storeDeepMemories([
+      {
+        content: { text_summary: "batch one", timestamp: Date.now() },
+        category: "interaction",
+      },
+      { content: { text_summary: "batch two", timestamp: Date.now() } },
+    ]);
+
+    assert.equal(ids.length, 2);
+    assert.ok(Number(ids[1]) > Number(ids[0]));
+    assert.equal(deepMemoryStats().total_memories, statsBefore.total_memories + 2);
+
+    const all = getRecentDeepMemories({ categories: ["interaction"] });
+    assert.ok(all.some((m) => m.content.text_summary === "batch one"));
+    assert.ok(all.some((m) => m.content.text_summary === "batch two"));
+  });
+
+  it("returns empty array for empty batch", () => {
+    assert.deepEqual(storeDeepMemories([]), []);
+  });
+});
+
+describe("withTransaction", () => {
+  it("returns the callback result and commits its writes", () => {
+    const before = deepMemoryStats().total_memories;
+    const id = withTransaction(() =>
+      storeDeepMemory({ text_summary: "in transaction" }, "interaction")
+    );
+    assert.ok(Number(id) > 0);
+    assert.equal(deepMemoryStats().total_memories, before + 1);
+  });
+
+  it("rolls back every write when the callback throws", () => {
+    const before = deepMemoryStats().total_memories;
+    assert.throws(() =>
+      withTransaction(() => {
+        storeDeepMemory({ text_summary: "rolled back" }, "interaction");
+        throw new Error("boom");
+      })
+    );
+    assert.equal(deepMemoryStats().total_memories, before);
+  });
+});
+
+describe("content_hash migration", () => {
+  it("merges duplicates into the oldest row and remaps lineage", async () => {
+    // Recreate a pre-index database holding two rows with the same hash
+    closeDb();
+    const Database = (await import("better-sqlite3")).default;
+    const raw = new Database(DEEP_MEMORY_DB);
+    raw.exec("DROP INDEX idx_deep_hash");
+    const insert = raw.prepare(
+      `INSERT INTO deep_memories
+         (timestamp, category, encrypted_blob, content_hash, dreamed, dream_date)
+       VALUES (?, 'test', 'blob', 'dup-hash', ?, ?)`
+    );
+    const keep = Number(insert.run(new Date().toISOString(), 0, null).lastInsertRowid);
+    const dup = Number(
+      insert.run(new Date().toISOString(), 1, "2026-01-01T00:00:00Z").lastInsertRowid
+    );
+    raw
+      .prepare(
+        `INSERT INTO dream_lineage (dream_filename, parent_memory_ids, created_at)
+         VALUES ('lineage.md', ?, ?)`
+      )
+      .run(JSON.stringify([dup, keep, 424242]), new Date().toISOString());
+    raw.close();
+
+    // Reopening runs the migration
+    deepMemoryStats();
+
+    const check = new Database(DEEP_MEMORY_DB, { readonly: true });
+    const rows = check
+      .prepare("SELECT id, dreamed, dream_date FROM deep_memories WHERE content_hash = ?")
+      .all("dup-hash") as Array<{ id: number; dreamed: number; dream_date: string }>;
+    const lineage = check
+      .prepare("SELECT parent_memory_ids FROM dream_lineage WHERE dream_filename = ?")
+      .get("lineage.md") as { parent_memory_ids: string };
+    check.close();
+
+    assert.deepEqual(rows, [
+      { id: keep, dreamed: 1, dream_date: "2026-01-01T00:00:00Z" },
+    ]);
+    assert.deepEqual(JSON.parse(lineage.parent_memory_ids), [keep, 424242]);
+  });
+});
+
 after(() => {
   closeDb();
   rmSync(testDir, { recursive: true, force: true, maxRetries: 3, retryDelay: 100 });
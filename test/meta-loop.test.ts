@@ -83,6 +83,14 @@ describe("updateMetaLoopDepth", () => {
     const state = loadState();
     assert.equal(state.meta_loop_depth, 1);
   });
+
+  it("updates a caller-supplied state without saving it", () => {
+    const pending = loadState();
+    const depth = updateMetaLoopDepth(["dream cycles", "meta patterns"], pending);
+    assert.equal(depth, 1);
+    assert.equal(pending.meta_loop_depth, 1);
+    assert.equal(loadState().meta_loop_depth, 0);
+  });
 });
 
 describe("getSteeringDirective", () => {
@@ -3,6 +3,7 @@ import assert from "node:assert/strict";
 
 const {
   renderTemplate,
+  renderDreamSystemBlocks,
   DREAM_SYSTEM_PROMPT,
   NIGHTMARE_SYSTEM_PROMPT,
   META_DREAM_PROMPT,
@@ -32,6 +33,37 @@ describe("renderTemplate", () => {
   });
 });
 
+describe("renderDreamSystemBlocks", () => {
+  const vars = {
+    agent_identity: "sheep",
+    explored_territory: "old insight",
+    memories: "today",
+  };
+
+  it("splits the static persona from the per-cycle prompt", () => {
+    const blocks = renderDreamSystemBlocks(DREAM_SYSTEM_PROMPT, vars, "\n\nsteer");
+    assert.equal(blocks.length, 2);
+    assert.ok(!blocks[0].text.includes("old insight"));
+    assert.ok(blocks[1].text.startsWith("old insight"));
+    assert.ok(blocks[1].text.includes("today"));
+    assert.ok(blocks[1].text.endsWith("steer"));
+  });
+
+  it("joins back to the fully rendered template", () => {
+    for (const template of [DREAM_SYSTEM_PROMPT, NIGHTMARE_SYSTEM_PROMPT]) {
+      const blocks = renderDreamSystemBlocks(template, vars);
+      assert.equal(blocks.map((b) => b.text).join(""), renderTemplate(template, vars));
+    }
+  });
+
+  it("only marks the persona block as cacheable when asked", () => {
+    const uncached = renderDreamSystemBlocks(DREAM_SYSTEM_PROMPT, vars);
+    assert.deepEqual(uncached.map((b) => b.cache), [undefined, undefined]);
+    const cached = renderDreamSystemBlocks(DREAM_SYSTEM_PROMPT, vars, "", true);
+    assert.deepEqual(cached.map((b) => b.cache), [true, undefined]);
+  });
+});
+
 describe("Prompt templates", () => {
   it("DREAM_SYSTEM_PROMPT contains memories placeholder", () => {
     assert.ok(DREAM_SYSTEM_PROMPT.includes("{{memories}}"));
@@ -1,13 +1,13 @@
 import { describe, it, after } from "node:test";
 import assert from "node:assert/strict";
-import { mkdtempSync, rmSync, writeFileSync } from "node:fs";
+import { chmodSync, mkdtempSync, rmSync, statSync, writeFileSync } from "node:fs";
 import { join } from "node:path";
 import { tmpdir } from "node:os";
 
 const testDir = mkdtempSync(join(tmpdir(), "es-state-test-"));
 process.env.OPENCLAWDREAMS_DATA_DIR = testDir;
 
-const { loadState, saveState } = await import("../src/state.js");
+const { loadState, saveState, writeFileAtomic } = await import("../src/state.js");
 const { STATE_FILE } = await import("../src/config.js");
 const { closeLogger } = await import("../src/logger.js");
 
@@ -51,6 +51,22 @@ describe("State persistence", () => {
   });
 });
 
+describe("writeFileAtomic", () => {
+  it("keeps an existing file's permissions", () => {
+    const file = join(testDir, "locked.json");
+    writeFileSync(file, "{}");
+    chmodSync(file, 0o600);
+    writeFileAtomic(file, '{"a":1}');
+    assert.equal(statSync(file).mode & 0o777, 0o600);
+  });
+
+  it("applies the requested mode to a new file", () => {
+    const file = join(testDir, "fresh.json");
+    writeFileAtomic(file, "{}", 0o600);
+    assert.equal(statSync(file).mode & 0o777, 0o600);
+  });
+});
+
 after(async () => {
   await closeLogger();
   rmSync(testDir, { recursive: true, force: true, maxRetries: 3, retryDelay: 100 });
@@ -9,9 +9,10 @@ import type { LLMClient, SynthesisContext } from "../src/types.js";
 const testDir = mkdtempSync(join(tmpdir(), "es-synthesis-test-"));
 process.env.OPENCLAWDREAMS_DATA_DIR = testDir;
 
-const { synthesizeContext } = await import("../src/synthesis.js");
+const { synthesizeContext, splitMemoryTrace } = await import("../src/synthesis.js");
 const { SYNTHESIS_PROMPT, SEEDING_PROMPT } = await import("../src/persona.js");
 const { closeLogger } = await import("../src/logger.js");
+const { flattenSystemPrompt } = await import("../src/llm.js");
 
 after(async () => {
   closeLogger();
@@ -28,7 +29,7 @@ function captureSystemClient(): {
   const client: LLMClient = {
     async createMessage(params) {
       calls.push({
-        system: params.system,
+        system: flattenSystemPrompt(params.system),
         content: params.messages[0].content,
       });
       return { text: "test response", usage: { input_tokens: 10, output_tokens: 10 } };
@@ -84,9 +85,78 @@ describe("synthesizeContext mode selection", () => {
     assert.equal(calls.length, 0);
   });
 
+  it("sends the prompt uncached with the vocabulary hint appended", async () => {
+    let system: unknown;
+    const client: LLMClient = {
+      async createMessage(params) {
+        system = params.system;
+        return { text: "test response" };
+      },
+    };
+    await synthesizeContext(client, baseContext, "VOCAB HINT");
+    assert.equal(typeof system, "string");
+    assert.ok((system as string).endsWith("\n\nVOCAB HINT"));
+  });
+
   it("SEEDING_PROMPT and SYNTHESIS_PROMPT are distinct exports", () => {
     assert.ok(SYNTHESIS_PROMPT.length > 0);
     assert.ok(SEEDING_PROMPT.length > 0);
     assert.notEqual(SYNTHESIS_PROMPT, SEEDING_PROMPT);
   });
+
+  it("both prompts ask for a trailing memory trace", () => {
+    assert.ok(SYNTHESIS_PROMPT.includes("MEMORY TRACE:"));
+    assert.ok(SEEDING_PROMPT.includes("MEMORY TRACE:"));
+  });
+});
+
+describe("splitMemoryTrace", () => {
+  it("separates the trailing trace from the synthesis", () => {
+    const { synthesis, memoryTrace } = splitMemoryTrace(
+      "First paragraph.\n\nSecond paragraph.\n\nMEMORY TRACE: Mapped async bugs; intriguing."
+    );
+    assert.equal(synthesis, "First paragraph.\n\nSecond paragraph.");
+    assert.equal(memoryTrace, "Mapped async bugs; intriguing.");
+  });
+
+  it("accepts a bolded label", () => {
+    const { memoryTrace } = splitMemoryTrace("Body.\n**MEMORY TRACE:** A sentence.");
+    assert.equal(memoryTrace, "A sentence.");
+  });
+
+  it("reads a trace written on the line after the label", () => {
+    const { synthesis, memoryTrace } = splitMemoryTrace(
+      "Body.\n\nMEMORY TRACE:\nA sentence on its own line."
+    );
+    assert.equal(synthesis, "Body.");
+    assert.equal(memoryTrace, "A sentence on its own line.");
+  });
+
+  it("accepts an italic label", () => {
+    const { synthesis, memoryTrace } = splitMemoryTrace(
+      "Body.\n*MEMORY TRACE:* A sentence."
+    );
+    assert.equal(synthesis, "Body.");
+    assert.equal(memoryTrace, "A sentence.");
+  });
+
+  it("strips a trace that is followed by more text", () => {
+    const { synthesis, memoryTrace } = splitMemoryTrace(
+      "Body.\n\nMEMORY TRACE: A sentence.\n\nHope that helps!"
+    );
+    assert.equal(synthesis, "Body.");
+    assert.equal(memoryTrace, "A sentence.");
+  });
+
+  it("strips a bare label even when no trace follows", () => {
+    const { synthesis, memoryTrace } = splitMemoryTrace("Body.\n\n**MEMORY TRACE:**");
+    assert.equal(synthesis, "Body.");
+    assert.equal(memoryTrace, null);
+  });
+
+  it("returns a null trace when none is present", () => {
+    const { synthesis, memoryTrace } = splitMemoryTrace("Just a synthesis.");
+    assert.equal(synthesis, "Just a synthesis.");
+    assert.equal(memoryTrace, null);
+  });
 });
@@ -0,0 +1,118 @@
+import { describe, it, after } from "node:test";
+import assert from "node:assert/strict";
+import { mkdtempSync, rmSync } from "node:fs";
+import { join } from "node:path";
+import { tmpdir } from "node:os";
+import type { LLMClient } from "../src/types.js";
+
+const testDir = mkdtempSync(join(tmpdir(), "es-topics-test-"));
+process.env.OPENCLAWDREAMS_DATA_DIR = testDir;
+
+const { extractTopicsFromConversations } = await import("../src/topics.js");
+const { storeDeepMemory } = await import("../src/memory.js");
+const { loadState, saveState } = await import("../src/state.js");
+const { closeLogger } = await import("../src/logger.js");
+
+function countingClient(text: string): LLMClient & { calls: number } {
+  const client = {
+    calls: 0,
+    async createMessage() {
+      client.calls++;
+      return { text, usage: { input_tokens: 100, output_tokens: 50 } };
+    },
+  };
+  return client;
+}
+
+describe("extractTopicsFromConversations cache", () => {
+  it("reuses topics while the conversations are unchanged", async () => {
+    storeDeepMemory(
+      { summary: "Tuned the SQLite pragmas", type: "agent_conversation" },
+      "interaction"
+    );
+
+    const client = countingClient("sqlite tuning\nwrite-ahead logging");
+    const first = await extractTopicsFromConversations(client);
+    const second = await extractTopicsFromConversations(client);
+
+    assert.equal(client.calls, 1);
+    assert.deepEqual(second.topics, first.topics);
+  });
+
+  it("never writes conversation words to state", () => {
+    const cache = loadState().topic_cache;
+    assert.ok(cache?.concept_signature);
+    // Topics are kept (as last_reflection_topics already is); conversation words are not
+    const serialized = JSON.stringify(cache);
+    assert.ok(!serialized.includes("tuned"));
+    assert.ok(!serialized.includes("pragmas"));
+  });
+
+  it("re-extracts when a new conversation arrives", async () => {
+    storeDeepMemory(
+      { summary: "Reviewed the release checklist", type: "agent_conversation" },
+      "interaction"
+    );
+
+    const client = countingClient("release process");
+    const { topics } = await extractTopicsFromConversations(client);
+
+    assert.equal(client.calls, 1);
+    assert.deepEqual(topics, ["release process"]);
+  });
+
+  it("reuses topics for near-identical conversations", async () => {
+    // Same concepts, different exact prompt (e.g. shifted timestamps)
+    const state = loadState();
+    assert.ok(state.topic_cache);
+    state.topic_cache.key = "stale";
+    saveState(state);
+
+    const client = countingClient("should not be called");
+    const { topics } = await extractTopicsFromConversations(client);
+
+    assert.equal(client.calls, 0);
+    assert.deepEqual(topics, ["release process"]);
+  });
+
+  it("keeps state written while the extraction call is in flight", async () => {
+    storeDeepMemory(
+      { summary: "Paired on the scheduler rewrite", type: "agent_conversation" },
+      "interaction"
+    );
+
+    const client: LLMClient = {
+      async createMessage() {
+        const state = loadState();
+        state.checks_today = 42;
+        saveState(state);
+        return {
+          text: "scheduler rewrite",
+          usage: { input_tokens: 1, output_tokens: 1 },
+        };
+      },
+    };
+    await extractTopicsFromConversations(client);
+
+    const state = loadState();
+    assert.equal(state.checks_today, 42);
+    assert.deepEqual(state.topic_cache?.topics, ["scheduler rewrite"]);
+  });
+
+  it("ignores an expired cache entry", async () => {
+    const state = loadState();
+    assert.ok(state.topic_cache);
+    state.topic_cache.created_at = new Date(0).toISOString();
+    saveState(state);
+
+    const client = countingClient("release process");
+    await extractTopicsFromConversations(client);
+
+    assert.equal(client.calls, 1);
+  });
+});
+
+after(async () => {
+  await closeLogger();
+  rmSync(testDir, { recursive: true, force: true, maxRetries: 3, retryDelay: 100 });
+});
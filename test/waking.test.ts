@@ -178,6 +178,32 @@ describe("runReflectionCycle", () => {
     );
   });
 
+  it("uses the synthesis memory trace instead of a summary call", async () => {
+    storeDeepMemory(
+      { summary: "Refactored the billing module", type: "agent_conversation" },
+      "interaction"
+    );
+
+    let calls = 0;
+    const responses = [
+      "billing refactor",
+      "Synthesis of the billing refactor.\n\nMEMORY TRACE: Untangled billing code; satisfying.",
+    ];
+    const client: LLMClient = {
+      async createMessage() {
+        const text = responses[calls] ?? "unexpected summary call";
+        calls++;
+        return { text, usage: { input_tokens: 100, output_tokens: 50 } };
+      },
+    };
+
+    const api = mockOpenClawAPIWithMemory();
+    await runReflectionCycle(client, api);
+
+    assert.equal(calls, 2, "Expected no separate summarization call");
+    assert.ok(!api.storedMemories[0].content.includes("MEMORY TRACE"));
+  });
+
   it("handles topic extraction returning no topics", async () => {
     storeDeepMemory(
       { summary: "Had a brief chat", type: "agent_conversation" },